@@ -1,11 +1,38 @@
+import bisect
+import copy
+import functools
+import hashlib
+import os
+import tempfile
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Mapping
 import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from ..utils.progress_tracker import track_usage
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# <repo>/config, resolved once at import
+_DEFAULT_CONFIG_DIR = Path(__file__).resolve().parents[3] / "config"
+
+# Preset file extensions, in order of preference
+_PRESET_SUFFIXES = ('.yaml', '.yml')
+
+# Mixed into sidecar cache digests; bump when the config models change shape
+_PRESET_CACHE_VERSION = b"cfpreset-v3"
+
+# Shared by all config models: unknown keys are rejected (typos in presets
+# fail loudly) and instances are immutable, so cached configs can be shared.
+_MODEL_CONFIG = ConfigDict(extra='forbid', frozen=True)
+
 class CleaningConfig(BaseModel):
     """Configuration for point cloud cleaning operations."""
+    model_config = _MODEL_CONFIG
+    
     statistical_outlier: Dict[str, float] = Field(default={
         'neighbors': 30,
         'std_ratio': 1.5
@@ -17,6 +44,8 @@ class CleaningConfig(BaseModel):
     
 class ThinningConfig(BaseModel):
     """Configuration for point cloud thinning/optimization."""
+    model_config = _MODEL_CONFIG
+    
     method: str = Field(default="voxel", description="Thinning method: voxel, adaptive, or random")
     voxel_size: float = Field(default=0.01, description="Voxel size in meters for voxel-based thinning")
     target_points: Optional[int] = Field(default=None, description="Target number of points")
@@ -24,6 +53,8 @@ class ThinningConfig(BaseModel):
 
 class ReflectionConfig(BaseModel):
     """Configuration for glass/reflection detection."""
+    model_config = _MODEL_CONFIG
+    
     intensity_available: bool = Field(default=False)
     intensity_threshold: float = Field(default=0.95, description="Threshold for glass detection")
     glass_detection: bool = Field(default=True)
@@ -31,6 +62,8 @@ class ReflectionConfig(BaseModel):
 
 class ScannerConfig(BaseModel):
     """Scanner-specific configuration."""
+    model_config = _MODEL_CONFIG
+    
     name: str
     typical_noise: float = Field(description="Typical noise level in meters")
     max_range: Optional[float] = Field(default=None, description="Maximum range in meters")
@@ -39,17 +72,110 @@ class ScannerConfig(BaseModel):
 
 class ProcessingConfig(BaseModel):
     """Complete processing configuration."""
+    model_config = _MODEL_CONFIG
+    
     scanner: ScannerConfig
     cleaning: CleaningConfig = Field(default_factory=CleaningConfig)
     thinning: ThinningConfig = Field(default_factory=ThinningConfig)
     reflection: ReflectionConfig = Field(default_factory=ReflectionConfig)
     
-    @validator('thinning')
+    @field_validator('thinning')
+    @classmethod
     def validate_thinning_method(cls, v):
         if v.method not in ['voxel', 'adaptive', 'random']:
             raise ValueError("Thinning method must be 'voxel', 'adaptive', or 'random'")
         return v
 
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its stat signature.
+    
+    The mtime/size arguments are only part of the cache key: an edited file
+    gets a new key and is parsed again. Callers must not mutate the result.
+    """
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+def _preset_header(config_data: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Pull the scanner name and noise out of parsed preset YAML.
+    
+    Skips full validation but coerces both values, so a malformed preset
+    raises here rather than when the header is formatted.
+    """
+    scanner = config_data['scanner']
+    return types.MappingProxyType({
+        'name': str(scanner['name']),
+        'typical_noise': float(scanner['typical_noise'])
+    })
+
+# Top-level sections a config file must define; the rest have defaults
+_REQUIRED_CONFIG_KEYS = frozenset(
+    name for name, field in ProcessingConfig.model_fields.items() if field.is_required()
+)
+
+# Point-count brackets for adaptive configs: <=1M, >1M, >10M, >50M points
+_POINT_COUNT_THRESHOLDS = (1_000_000, 10_000_000, 50_000_000)
+# Voxel size as a multiple of scanner noise, per bracket
+_VOXEL_NOISE_FACTORS = (2, 3, 5, 8)
+
+@functools.lru_cache(maxsize=64)
+def _build_adaptive_config(scanner_name: str, size_bucket: int, has_intensity: bool) -> ProcessingConfig:
+    """
+    Build the adaptive configuration for one point-count bracket.
+    
+    Every point count within a bracket yields the same configuration, so
+    results are memoized on the bracket index instead of the raw count.
+    """
+    # Basic noise estimation based on common scanners
+    noise_map = {
+        'leica': 0.002,  # 2mm
+        'faro': 0.003,   # 3mm
+        'riegl': 0.005,  # 5mm
+        'trimble': 0.004  # 4mm
+    }
+    
+    typical_noise = 0.005  # Default 5mm
+    for scanner_type, noise in noise_map.items():
+        if scanner_type.lower() in scanner_name.lower():
+            typical_noise = noise
+            break
+    
+    # Adaptive voxel size based on point density
+    voxel_size = typical_noise * _VOXEL_NOISE_FACTORS[size_bucket]
+    dense = size_bucket >= 2  # > 10M points
+    
+    config_data = {
+        'scanner': {
+            'name': scanner_name,
+            'typical_noise': typical_noise
+        },
+        'cleaning': {
+            'statistical_outlier': {
+                'neighbors': 20 if dense else 30,
+                'std_ratio': 1.5
+            },
+            'radius_outlier': {
+                'radius': typical_noise * 20,
+                'min_neighbors': 8 if dense else 10
+            }
+        },
+        'thinning': {
+            'method': 'voxel',
+            'voxel_size': voxel_size,
+            'preserve_boundaries': True
+        },
+        'reflection': {
+            'intensity_available': has_intensity,
+            'intensity_threshold': 0.95,
+            'glass_detection': has_intensity,
+            'clustering_epsilon': typical_noise * 10
+        }
+    }
+    
+    return ProcessingConfig(**config_data)
+
 @track_usage("cloudforge.config.manager")
 class ConfigManager:
     """
@@ -58,45 +184,216 @@ class ConfigManager:
     """
     
     def __init__(self, config_dir: Path = None):
-        if config_dir is None:
-            config_dir = Path(__file__).parent.parent.parent.parent / "config"
-        self.config_dir = Path(config_dir)
+        self.config_dir = Path(config_dir) if config_dir is not None else _DEFAULT_CONFIG_DIR
         self.presets_dir = self.config_dir / "presets"
+        self.cache_dir = self.presets_dir / ".cache"
         self.templates_dir = self.config_dir / "templates"
         
-        # Ensure directories exist
-        self.presets_dir.mkdir(parents=True, exist_ok=True)
-        self.templates_dir.mkdir(parents=True, exist_ok=True)
+        # Directories are created on first write (save_preset, sidecar cache)
         
         self.loaded_configs: Dict[str, ProcessingConfig] = {}
+        # (mtime_ns, size) of the preset file each loaded config came from
+        self._config_stamps: Dict[str, Tuple[int, int]] = {}
+        # Preset name -> file, built lazily on first lookup
+        self._preset_index: Optional[Dict[str, Path]] = None
+        # Preset file -> ((mtime_ns, size), header) for load_preset_headers
+        self._header_cache: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
     
     def load_preset(self, preset_name: str) -> ProcessingConfig:
         """
         Load a scanner preset configuration.
         
         Args:
-            preset_name: Name of the preset (without .yaml extension)
+            preset_name: Name of the preset (without .yaml/.yml extension)
             
         Returns:
             Validated ProcessingConfig object
         """
-        preset_file = self.presets_dir / f"{preset_name}.yaml"
+        preset_file = self._preset_path(preset_name)
         
-        if not preset_file.exists():
+        try:
+            st = preset_file.stat() if preset_file is not None else None
+        except FileNotFoundError:
+            st = None
+        
+        if st is None:
+            # Rescans the directory, so deleted presets drop out of the index
             available = self.list_presets()
             raise FileNotFoundError(
                 f"Preset '{preset_name}' not found. Available presets: {available}"
             )
         
-        with open(preset_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+        # Reuse the validated config while the file is unchanged on disk
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._config_stamps.get(preset_name) == stamp:
+            return self.loaded_configs[preset_name]
+        
+        # Warm start: the sidecar holds the validated config for this exact content
+        digest = hashlib.blake2b(preset_file.read_bytes(), digest_size=8,
+                                 person=_PRESET_CACHE_VERSION).hexdigest()
+        cache_file = self.cache_dir / f"{preset_name}.{digest}.json"
+        config = self._read_preset_cache(cache_file)
+        
+        if config is None:
+            config_data = _load_yaml_cached(str(preset_file), *stamp)
+            
+            # Validate and create config object
+            config = ProcessingConfig.model_validate(config_data)
+            self._write_preset_cache(preset_name, cache_file, config)
         
-        # Validate and create config object
-        config = ProcessingConfig(**config_data)
         self.loaded_configs[preset_name] = config
+        self._config_stamps[preset_name] = stamp
         
         return config
     
+    def load_preset_header(self, preset_name: str) -> Mapping[str, Any]:
+        """
+        Load only the scanner name and typical noise of a preset.
+        
+        Skips Pydantic validation, so listing many presets stays cheap.
+        Use load_preset() when the full, validated config is needed.
+        
+        Args:
+            preset_name: Name of the preset (without .yaml/.yml extension)
+            
+        Returns:
+            Read-only mapping with 'name' and 'typical_noise' keys
+        """
+        header, error = self.load_preset_headers([preset_name])[0]
+        if error is not None:
+            raise error
+        return header
+    
+    def load_preset_headers(self, 
+                            preset_names: List[str]) -> List[Tuple[Optional[Mapping[str, Any]], Optional[Exception]]]:
+        """
+        Load the headers of several presets, reading uncached files concurrently.
+        
+        Files that changed since they were last read are fetched with one
+        read_bytes() each on a thread pool, so the I/O overlaps, then parsed
+        serially with the C YAML loader. Unchanged files come from a cache
+        keyed on their stat signature.
+        
+        Args:
+            preset_names: Names of the presets (without .yaml/.yml extension)
+            
+        Returns:
+            One (header, error) pair per name, in input order; exactly one of
+            the two is None, so a broken preset doesn't hide the others
+        """
+        results: List[Tuple[Optional[Mapping[str, Any]], Optional[Exception]]] = []
+        # Index into results -> (path, stamp) for files that need reading
+        pending: Dict[int, Tuple[Path, Tuple[int, int]]] = {}
+        
+        for i, preset_name in enumerate(preset_names):
+            preset_file = self._preset_path(preset_name)
+            try:
+                if preset_file is None:
+                    raise FileNotFoundError(
+                        f"Preset '{preset_name}' not found. Available presets: {self.list_presets()}"
+                    )
+                st = preset_file.stat()
+            except OSError as e:
+                results.append((None, e))
+                continue
+            
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._header_cache.get(str(preset_file))
+            if cached is not None and cached[0] == stamp:
+                results.append((cached[1], None))
+            else:
+                results.append((None, None))
+                pending[i] = (preset_file, stamp)
+        
+        if not pending:
+            return results
+        
+        def read(preset_file):
+            try:
+                return preset_file.read_bytes(), None
+            except OSError as e:
+                return None, e
+        
+        files = [preset_file for preset_file, _ in pending.values()]
+        if len(files) == 1:
+            contents = [read(files[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+                contents = list(executor.map(read, files))
+        
+        for (i, (preset_file, stamp)), (data, error) in zip(pending.items(), contents):
+            if error is None:
+                try:
+                    header = _preset_header(yaml.load(data, Loader=_YAML_LOADER))
+                    self._header_cache[str(preset_file)] = (stamp, header)
+                except Exception as e:
+                    error = e
+            results[i] = (header, None) if error is None else (None, error)
+        
+        return results
+    
+    def _scan_presets(self) -> Dict[str, Path]:
+        """Scan the presets directory and rebuild the name -> path index."""
+        # scandir entries carry the file type, so no per-file stat is needed
+        index = {}
+        try:
+            with os.scandir(self.presets_dir) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext not in _PRESET_SUFFIXES or not entry.is_file():
+                        continue
+                    # foo.yaml wins over foo.yml whatever the directory order
+                    if stem not in index or ext == '.yaml':
+                        index[stem] = Path(entry.path)
+        except FileNotFoundError:
+            # Nothing saved yet; the directory is created by save_preset
+            pass
+        self._preset_index = index
+        return index
+    
+    def _preset_path(self, preset_name: str) -> Optional[Path]:
+        """Resolve a preset name to its file, rescanning once on a miss."""
+        index = self._preset_index
+        if index is None or preset_name not in index:
+            index = self._scan_presets()
+        return index.get(preset_name)
+    
+    def _read_preset_cache(self, cache_file: Path) -> Optional[ProcessingConfig]:
+        """
+        Load a JSON config sidecar, or None if missing or unreadable.
+        
+        The sidecar is plain data validated like the YAML, so a planted file
+        in a shared presets directory can at worst yield a bad config, never
+        run code.
+        """
+        try:
+            return ProcessingConfig.model_validate_json(cache_file.read_bytes())
+        except Exception:
+            # Missing, corrupt or incompatible sidecar - fall back to the YAML
+            return None
+    
+    def _write_preset_cache(self, preset_name: str, cache_file: Path, config: ProcessingConfig):
+        """Atomically write a config sidecar and drop stale ones for the preset."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(config.model_dump_json())
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            
+            # Also clears pickle sidecars left by older versions
+            for stale in self.cache_dir.glob(f"{preset_name}.*"):
+                if (stale != cache_file and stale.suffix in ('.json', '.pkl')
+                        and stale.name.rsplit('.', 2)[0] == preset_name):
+                    stale.unlink()
+        except OSError:
+            # Read-only config directories simply run without the sidecar cache
+            pass
+    
     def save_preset(self, preset_name: str, config: ProcessingConfig):
         """
         Save a configuration as a named preset.
@@ -108,17 +405,22 @@ class ConfigManager:
         preset_file = self.presets_dir / f"{preset_name}.yaml"
         
         # Convert to dict and save as YAML
-        config_dict = config.dict()
+        config_dict = config.model_dump(mode='python')
         
+        self.presets_dir.mkdir(parents=True, exist_ok=True)
         with open(preset_file, 'w') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_dict, f, Dumper=_YAML_DUMPER,
+                      default_flow_style=False, sort_keys=False)
         
+        st = preset_file.stat()
+        if self._preset_index is not None:
+            self._preset_index[preset_name] = preset_file
         self.loaded_configs[preset_name] = config
+        self._config_stamps[preset_name] = (st.st_mtime_ns, st.st_size)
     
     def list_presets(self) -> List[str]:
         """Get list of available preset names."""
-        preset_files = self.presets_dir.glob("*.yaml")
-        return [f.stem for f in preset_files]
+        return list(self._scan_presets())
     
     def create_preset_from_template(self, 
                                     preset_name: str, 
@@ -140,9 +442,16 @@ class ConfigManager:
         # Load template or create default
         template_file = self.templates_dir / f"{template}.yaml"
         
-        if template_file.exists():
-            with open(template_file, 'r') as f:
-                base_config = yaml.safe_load(f)
+        try:
+            st = template_file.stat()
+        except FileNotFoundError:
+            st = None
+        
+        if st is not None:
+            # Parsed once per file version; copy before filling in the scanner
+            base_config = copy.deepcopy(
+                _load_yaml_cached(str(template_file), st.st_mtime_ns, st.st_size)
+            )
         else:
             # Create default configuration
             base_config = {
@@ -199,6 +508,44 @@ class ConfigManager:
             return self.load_preset(preset_name)
         return self.loaded_configs[preset_name]
     
+    def quick_validate(self, config_file: Path) -> bool:
+        """
+        Cheap structural check: the file parses as a YAML mapping with the
+        required top-level keys. Run validate_config_file for the full schema.
+        
+        Args:
+            config_file: Path to configuration file
+            
+        Returns:
+            True if the file passes the structural check, False otherwise
+        """
+        config_file = Path(config_file)
+        try:
+            st = config_file.stat()
+            config_data = _load_yaml_cached(str(config_file), st.st_mtime_ns, st.st_size)
+        except yaml.YAMLError as e:
+            mark = getattr(e, 'problem_mark', None)
+            if mark is not None:
+                print(f"Configuration validation failed: invalid YAML at line {mark.line + 1}, "
+                      f"column {mark.column + 1}: {getattr(e, 'problem', e)}")
+            else:
+                print(f"Configuration validation failed: invalid YAML: {e}")
+            return False
+        except OSError as e:
+            print(f"Configuration validation failed: {e}")
+            return False
+        
+        if not isinstance(config_data, dict):
+            print("Configuration validation failed: top level must be a mapping")
+            return False
+        
+        missing = _REQUIRED_CONFIG_KEYS - config_data.keys()
+        if missing:
+            print(f"Configuration validation failed: missing required section(s): {', '.join(sorted(missing))}")
+            return False
+        
+        return True
+    
     def validate_config_file(self, config_file: Path) -> bool:
         """
         Validate a YAML configuration file.
@@ -209,10 +556,12 @@ class ConfigManager:
         Returns:
             True if valid, False otherwise
         """
+        config_file = Path(config_file)
         try:
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
-            ProcessingConfig(**config_data)
+            # Shares the parse with quick_validate while the file is unchanged
+            st = config_file.stat()
+            config_data = _load_yaml_cached(str(config_file), st.st_mtime_ns, st.st_size)
+            ProcessingConfig.model_validate(config_data)
             return True
         except Exception as e:
             print(f"Configuration validation failed: {e}")
@@ -223,7 +572,8 @@ class ConfigManager:
         config = self.get_config(preset_name)
         
         with open(output_file, 'w') as f:
-            yaml.dump(config.dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config.model_dump(mode='python'), f, Dumper=_YAML_DUMPER,
+                      default_flow_style=False, sort_keys=False)
     
     def get_adaptive_config(self, 
                             scanner_name: str, 
@@ -240,56 +590,7 @@ class ConfigManager:
         Returns:
             Optimized ProcessingConfig
         """
-        # Basic noise estimation based on common scanners
-        noise_map = {
-            'leica': 0.002,  # 2mm
-            'faro': 0.003,   # 3mm
-            'riegl': 0.005,  # 5mm
-            'trimble': 0.004  # 4mm
-        }
-        
-        typical_noise = 0.005  # Default 5mm
-        for scanner_type, noise in noise_map.items():
-            if scanner_type.lower() in scanner_name.lower():
-                typical_noise = noise
-                break
-        
-        # Adaptive voxel size based on point density
-        if point_count > 50_000_000:  # > 50M points
-            voxel_size = typical_noise * 8
-        elif point_count > 10_000_000:  # > 10M points  
-            voxel_size = typical_noise * 5
-        elif point_count > 1_000_000:   # > 1M points
-            voxel_size = typical_noise * 3
-        else:
-            voxel_size = typical_noise * 2
-        
-        config_data = {
-            'scanner': {
-                'name': scanner_name,
-                'typical_noise': typical_noise
-            },
-            'cleaning': {
-                'statistical_outlier': {
-                    'neighbors': 20 if point_count > 10_000_000 else 30,
-                    'std_ratio': 1.5
-                },
-                'radius_outlier': {
-                    'radius': typical_noise * 20,
-                    'min_neighbors': 8 if point_count > 10_000_000 else 10
-                }
-            },
-            'thinning': {
-                'method': 'voxel',
-                'voxel_size': voxel_size,
-                'preserve_boundaries': True
-            },
-            'reflection': {
-                'intensity_available': has_intensity,
-                'intensity_threshold': 0.95,
-                'glass_detection': has_intensity,
-                'clustering_epsilon': typical_noise * 10
-            }
-        }
-        
-        return ProcessingConfig(**config_data)
\ No newline at end of file
+        size_bucket = bisect.bisect_left(_POINT_COUNT_THRESHOLDS, point_count)
+        # Frozen models still hold mutable dicts; copy so callers can't
+        # alter the cached instance
+        return _build_adaptive_config(scanner_name, size_bucket, has_intensity).model_copy(deep=True)
@@ -1,5 +1,12 @@
+import contextlib
+import itertools
+import json
+import os
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping, Iterator
 import numpy as np
 from ..utils.progress_tracker import track_usage
 
@@ -9,6 +16,182 @@ try:
 except ImportError:
     HAS_OPEN3D = False
 
+# Rows formatted per write() call for text exports
+_TEXT_CHUNK_ROWS = 65536
+
+def _format_text_rows(f, data: np.ndarray, fmt: str):
+    """
+    Write an (N, k) array, or a structured array of N records, as text rows.
+    
+    Output matches np.savetxt(f, data, fmt=fmt), but each chunk of rows is
+    rendered by a single %-format call instead of one per row.
+    """
+    row_fmt = fmt + '\n'
+    for start in range(0, len(data), _TEXT_CHUNK_ROWS):
+        chunk = data[start:start + _TEXT_CHUNK_ROWS]
+        if data.dtype.names:
+            # Records keep per-field types, e.g. ints for uint8 colors
+            values = tuple(itertools.chain.from_iterable(chunk.tolist()))
+        else:
+            values = tuple(chunk.ravel().tolist())
+        f.write((row_fmt * len(chunk)) % values)
+
+def _write_text_rows(filepath: Path, data: np.ndarray, fmt: str):
+    """Write text rows to a new file; see _format_text_rows."""
+    with open(filepath, 'w') as f:
+        _format_text_rows(f, data, fmt)
+
+# Upper bound on bytes handed to a single pwrite() call
+_WRITE_BLOCK_BYTES = 64 * 1024 * 1024
+
+def _write_binary_preallocated(fd: int, header: bytes, arr: np.ndarray) -> int:
+    """
+    Write a header followed by an array's raw bytes to an empty file.
+    
+    The full size is reserved up front with posix_fallocate where available,
+    so the filesystem allocates extents once instead of on every append, and
+    the array is written straight from its buffer without a tobytes() copy.
+    
+    Args:
+        fd: File descriptor opened for writing
+        header: Bytes written before the array data
+        arr: Array whose raw (C-order) bytes follow the header
+        
+    Returns:
+        Total number of bytes written
+    """
+    data = np.ascontiguousarray(arr).reshape(-1).view(np.uint8)
+    total = len(header) + data.nbytes
+    
+    if hasattr(os, 'posix_fallocate') and total:
+        try:
+            os.posix_fallocate(fd, 0, total)
+        except OSError:
+            # Not supported by every filesystem; plain writes still work
+            pass
+    
+    offset = 0
+    for block in (memoryview(header), memoryview(data)):
+        while len(block):
+            if hasattr(os, 'pwrite'):
+                written = os.pwrite(fd, block[:_WRITE_BLOCK_BYTES], offset)
+            else:
+                os.lseek(fd, offset, os.SEEK_SET)
+                written = os.write(fd, block[:_WRITE_BLOCK_BYTES])
+            block = block[written:]
+            offset += written
+    
+    return total
+
+def _open_for_write(filepath: Path) -> int:
+    """Open (create or truncate) a file for binary writing, returning its fd."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    return os.open(filepath, flags, 0o666)
+
+def _ply_vertex_records(points: np.ndarray,
+                        normals: Optional[np.ndarray],
+                        colors: Optional[np.ndarray]) -> np.ndarray:
+    """Pack points with optional normals and [0, 1] colors into binary PLY vertex records."""
+    fields = [('x', '<f8'), ('y', '<f8'), ('z', '<f8')]
+    if normals is not None:
+        fields += [('nx', '<f8'), ('ny', '<f8'), ('nz', '<f8')]
+    if colors is not None:
+        fields += [('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
+    
+    records = np.empty(len(points), dtype=fields)
+    for i, field in enumerate(('x', 'y', 'z')):
+        records[field] = points[:, i]
+    if normals is not None:
+        for i, field in enumerate(('nx', 'ny', 'nz')):
+            records[field] = normals[:, i]
+    if colors is not None:
+        # Round like Open3D's writer rather than truncating
+        channels = np.clip(np.rint(colors * 255), 0, 255)
+        for i, field in enumerate(('red', 'green', 'blue')):
+            records[field] = channels[:, i]
+    return records
+
+_PLY_PROPERTY_TYPES = {'<f8': 'double', '<f4': 'float', '|u1': 'uchar'}
+
+def _ply_header(records: np.ndarray) -> bytes:
+    """Binary little-endian PLY header describing a structured vertex array."""
+    lines = ['ply', 'format binary_little_endian 1.0', f'element vertex {len(records)}']
+    for name in records.dtype.names:
+        lines.append(f'property {_PLY_PROPERTY_TYPES[records.dtype[name].str]} {name}')
+    lines.append('end_header')
+    return ('\n'.join(lines) + '\n').encode('ascii')
+
+def xyzbin_header_path(filepath: Path) -> Path:
+    """Companion JSON header path for a .xyzbin file."""
+    return filepath.with_name(filepath.name + '.json')
+
+def _xyzbin_origin(first_point) -> np.ndarray:
+    """
+    Origin subtracted from .xyzbin coordinates: the first point, floored.
+    
+    Storing float32 offsets from a nearby origin instead of absolute values
+    keeps millimeter precision for georeferenced coordinates in the millions
+    of meters, where absolute float32 steps are about half a meter.
+    """
+    return np.floor(np.asarray(first_point, dtype=np.float64))
+
+def _write_xyzbin_header(filepath: Path, points: int, origin: np.ndarray):
+    """Write the JSON header describing a .xyzbin file."""
+    header = {
+        'format': 'xyzbin',
+        'version': 2,
+        'dtype': '<f4',
+        'columns': ['x', 'y', 'z'],
+        'offset': [float(v) for v in origin],
+        'points': points
+    }
+    with open(xyzbin_header_path(filepath), 'w') as f:
+        json.dump(header, f)
+
+class ChunkWriter:
+    """
+    Appends point chunks to a single output file.
+    
+    Chunks are structured arrays as yielded by PointCloudLoader.load_chunks:
+    x/y/z fields plus optional r/g/b uint8 fields.
+    """
+    
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.suffix = filepath.suffix.lower()
+        self.points_written = 0
+        self.has_colors = False
+        # xyzbin origin, taken from the first point written
+        self.origin = None
+        self._file = open(filepath, 'wb' if self.suffix == '.xyzbin' else 'w')
+    
+    def write_chunk(self, chunk: np.ndarray):
+        """Append one chunk of point records to the output."""
+        has_colors = 'r' in chunk.dtype.names
+        
+        if self.suffix == '.xyzbin':
+            if self.origin is None and len(chunk):
+                self.origin = _xyzbin_origin([chunk['x'][0], chunk['y'][0], chunk['z'][0]])
+            xyz = np.empty((len(chunk), 3), dtype='<f4')
+            for i, field in enumerate(('x', 'y', 'z')):
+                xyz[:, i] = chunk[field] - self.origin[i]
+            xyz.tofile(self._file)
+        elif self.suffix == '.pts' and has_colors:
+            _format_text_rows(self._file, chunk[['x', 'y', 'z', 'r', 'g', 'b']],
+                              '%.6f %.6f %.6f %d %d %d')
+            self.has_colors = True
+        else:
+            _format_text_rows(self._file, chunk[['x', 'y', 'z']], '%.6f %.6f %.6f')
+        
+        self.points_written += len(chunk)
+    
+    def close(self):
+        """Close the output and write any trailing metadata."""
+        self._file.close()
+        if self.suffix == '.xyzbin':
+            origin = self.origin if self.origin is not None else np.zeros(3)
+            _write_xyzbin_header(self.filepath, self.points_written, origin)
+
 @track_usage("cloudforge.io.exporter")
 class PointCloudExporter:
     """
@@ -16,10 +199,13 @@ class PointCloudExporter:
     Handles format-specific optimizations and metadata preservation.
     """
     
-    supported_formats = ['.ply', '.pcd', '.pts', '.xyz']
+    supported_formats = ['.ply', '.pcd', '.pts', '.xyz', '.xyzbin']
+    # Formats that can be written incrementally with stream()
+    streamable_formats = ['.pts', '.xyz', '.xyzbin']
     
     def __init__(self):
         self.export_stats = {}
+        self._stats_lock = threading.Lock()
     
     def export(self, 
                pcd, 
@@ -52,6 +238,8 @@ class PointCloudExporter:
                 return self._export_pts_format(pcd, filepath, **kwargs)
             elif suffix == '.xyz':
                 return self._export_xyz_format(pcd, filepath, **kwargs)
+            elif suffix == '.xyzbin':
+                return self._export_xyzbin_format(pcd, filepath, **kwargs)
         except Exception as e:
             print(f"Export failed: {e}")
             return False
@@ -68,6 +256,14 @@ class PointCloudExporter:
             write_vertex_normals = kwargs.get('write_normals', len(pcd.normals) > 0)
             write_vertex_colors = kwargs.get('write_colors', len(pcd.colors) > 0)
             
+            if not write_ascii:
+                return self._export_ply_binary(pcd, filepath, write_vertex_normals, write_vertex_colors)
+        
+        if not HAS_OPEN3D:
+            raise ImportError(f"Writing {filepath.suffix} files needs open3d. "
+                              "Install it with: pip install cloudforge[ply]")
+        
+        if filepath.suffix.lower() == '.ply':
             success = o3d.io.write_point_cloud(
                 str(filepath), 
                 pcd,
@@ -84,6 +280,32 @@ class PointCloudExporter:
         
         return success
     
+    def _export_ply_binary(self, 
+                           pcd, 
+                           filepath: Path, 
+                           write_normals: bool, 
+                           write_colors: bool) -> bool:
+        """
+        Export binary little-endian PLY without going through Open3D.
+        
+        Vertices are packed into one structured array (x y z [nx ny nz]
+        [red green blue], Open3D's property order) and written in a single
+        preallocated pass.
+        """
+        points = np.asarray(pcd.points)
+        normals = np.asarray(pcd.normals) if write_normals and len(pcd.normals) > 0 else None
+        colors = np.asarray(pcd.colors) if write_colors and len(pcd.colors) > 0 else None
+        
+        records = _ply_vertex_records(points, normals, colors)
+        fd = _open_for_write(filepath)
+        try:
+            total = _write_binary_preallocated(fd, _ply_header(records), records)
+        finally:
+            os.close(fd)
+        
+        self._record_export_stats(pcd, filepath, file_size=total)
+        return True
+    
     def _export_pts_format(self, 
                            pcd, 
                            filepath: Path, 
@@ -95,17 +317,27 @@ class PointCloudExporter:
         # Build output array
         if len(pcd.colors) > 0:
             colors = np.asarray(pcd.colors)
-            # Scale colors to 0-255 range if requested
-            if kwargs.get('scale_colors', True):
-                colors = (colors * 255).astype(np.uint8)
-            data = np.column_stack([points, colors])
+            scale_colors = kwargs.get('scale_colors', True)
+            
+            # One record per point keeps scaled colors as uint8 rather than
+            # upcasting the whole table to float64 as np.column_stack would
+            color_dtype = np.uint8 if scale_colors else np.float64
+            data = np.empty(len(points), dtype=[
+                ('x', np.float64), ('y', np.float64), ('z', np.float64),
+                ('r', color_dtype), ('g', color_dtype), ('b', color_dtype)
+            ])
+            for i, field in enumerate(('x', 'y', 'z')):
+                data[field] = points[:, i]
+            for i, field in enumerate(('r', 'g', 'b')):
+                # Scale colors to 0-255 range if requested
+                data[field] = colors[:, i] * 255 if scale_colors else colors[:, i]
             fmt = '%.6f %.6f %.6f %d %d %d'
         else:
             data = points
             fmt = '%.6f %.6f %.6f'
         
         try:
-            np.savetxt(filepath, data, fmt=fmt, delimiter=' ')
+            _write_text_rows(filepath, data, fmt)
             self._record_export_stats(pcd, filepath)
             return True
         except Exception:
@@ -120,26 +352,100 @@ class PointCloudExporter:
         points = np.asarray(pcd.points)
         
         try:
-            np.savetxt(filepath, points, fmt='%.6f %.6f %.6f', delimiter=' ')
+            _write_text_rows(filepath, points, '%.6f %.6f %.6f')
             self._record_export_stats(pcd, filepath)
             return True
         except Exception:
             return False
     
-    def _record_export_stats(self, pcd, filepath: Path):
+    def _export_xyzbin_format(self, 
+                              pcd, 
+                              filepath: Path, 
+                              **kwargs) -> bool:
+        """
+        Export to raw little-endian float32 XYZ with a JSON header alongside.
+        
+        Roughly a third of the size of ASCII XYZ. Coordinates are stored
+        relative to the header's offset, so float32 keeps sub-millimeter
+        precision up to a few kilometers from the first point.
+        """
+        points = np.asarray(pcd.points)
+        origin = _xyzbin_origin(points[0]) if len(points) else np.zeros(3)
+        
+        try:
+            fd = _open_for_write(filepath)
+            try:
+                total = _write_binary_preallocated(fd, b'', (points - origin).astype('<f4'))
+            finally:
+                os.close(fd)
+            _write_xyzbin_header(filepath, len(points), origin)
+            self._record_export_stats(pcd, filepath, file_size=total)
+            return True
+        except Exception:
+            return False
+    
+    @contextlib.contextmanager
+    def stream(self, filepath: Path) -> Iterator[ChunkWriter]:
+        """
+        Open an output file for chunked export.
+        
+        Yields a ChunkWriter; export stats are recorded once the block exits
+        without error. Only streamable_formats are supported.
+        
+        Args:
+            filepath: Output file path
+        """
+        filepath = Path(filepath)
+        suffix = filepath.suffix.lower()
+        
+        if suffix not in self.streamable_formats:
+            raise ValueError(f"Format {suffix} cannot be streamed. Streamable: {self.streamable_formats}")
+        
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        
+        writer = ChunkWriter(filepath)
+        try:
+            yield writer
+        finally:
+            writer.close()
+        
+        self._store_export_stats(filepath, writer.points_written, writer.has_colors, False)
+    
+    def _record_export_stats(self, pcd, filepath: Path, file_size: Optional[int] = None):
         """Record statistics about the exported point cloud."""
-        self.export_stats = {
-            'output_file': str(filepath),
-            'format': filepath.suffix,
-            'points_exported': len(pcd.points),
-            'has_colors': len(pcd.colors) > 0,
-            'has_normals': len(pcd.normals) > 0,
-            'file_size_mb': filepath.stat().st_size / (1024 * 1024) if filepath.exists() else 0
-        }
-    
-    def get_export_stats(self) -> Dict[str, Any]:
-        """Get statistics about the last export operation."""
-        return self.export_stats.copy()
+        self._store_export_stats(filepath,
+                                 len(pcd.points),
+                                 len(pcd.colors) > 0,
+                                 len(pcd.normals) > 0,
+                                 file_size)
+    
+    def _store_export_stats(self, 
+                            filepath: Path, 
+                            points: int, 
+                            has_colors: bool, 
+                            has_normals: bool, 
+                            file_size: Optional[int] = None):
+        """Store export statistics for get_export_stats; stats the file unless its size is known."""
+        if file_size is None:
+            try:
+                file_size = filepath.stat().st_size
+            except FileNotFoundError:
+                file_size = 0
+        
+        # Update slots in place; get_export_stats hands out a view of this dict.
+        # batch_export records from several threads, so update under the lock.
+        with self._stats_lock:
+            stats = self.export_stats
+            stats['output_file'] = str(filepath)
+            stats['format'] = filepath.suffix
+            stats['points_exported'] = points
+            stats['has_colors'] = has_colors
+            stats['has_normals'] = has_normals
+            stats['file_size_mb'] = file_size / (1024 * 1024)
+    
+    def get_export_stats(self) -> Mapping[str, Any]:
+        """Get a read-only view of statistics about the last export operation."""
+        return types.MappingProxyType(self.export_stats)
     
     def batch_export(self, 
                      pcd, 
@@ -148,6 +454,9 @@ class PointCloudExporter:
         """
         Export the same point cloud to multiple formats.
         
+        Formats are written concurrently on a small thread pool; the writers
+        are I/O bound and release the GIL while writing.
+        
         Args:
             pcd: Point cloud to export
             base_path: Base path without extension
@@ -159,16 +468,16 @@ class PointCloudExporter:
         if formats is None:
             formats = self.supported_formats
         
-        results = {}
         base_path = Path(base_path)
+        extensions = [fmt if fmt.startswith('.') else f'.{fmt}' for fmt in formats]
         
-        for fmt in formats:
-            if fmt.startswith('.'):
-                ext = fmt
-            else:
-                ext = f'.{fmt}'
-            
-            output_path = base_path.with_suffix(ext)
-            results[ext] = self.export(pcd, output_path)
+        if not extensions:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(4, len(extensions))) as executor:
+            futures = {
+                ext: executor.submit(self.export, pcd, base_path.with_suffix(ext))
+                for ext in extensions
+            }
         
-        return results
\ No newline at end of file
+        return {ext: future.result() for ext, future in futures.items()}
\ No newline at end of file
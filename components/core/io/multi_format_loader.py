@@ -1,21 +1,293 @@
+import json
+import mmap
+import os
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Mapping, Any, NamedTuple, Iterator
 import numpy as np
 from ..utils.progress_tracker import track_usage
+from .export_manager import xyzbin_header_path
+from .point_record import PointCloudArray, point_dtype
 
 try:
     import open3d as o3d
     HAS_OPEN3D = True
 except ImportError:
     HAS_OPEN3D = False
-    print("Warning: open3d not available, some functionality will be limited")
 
 try:
     import laspy
     HAS_LASPY = True
 except ImportError:
     HAS_LASPY = False
-    print("Warning: laspy not available, LAS/LAZ support disabled")
+
+# Points decoded per laspy chunk when streaming LAS/LAZ files
+_LAS_CHUNK_POINTS = 2_000_000
+
+# Default chunk size for PointCloudLoader.load_chunks
+_DEFAULT_CHUNK_POINTS = 1 << 20
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+def _intensity_to_gray(intensity: np.ndarray) -> np.ndarray:
+    """Normalize intensity to [0, 1] and expand it to (N, 3) grayscale colors."""
+    peak = intensity.max() if len(intensity) else 0
+    scale = np.float64(1.0 / peak) if peak else np.float64(0.0)
+    
+    # Normalize straight into the (N, 3) buffer - one allocation, one pass
+    colors = np.empty((len(intensity), 3), dtype=np.float64)
+    np.multiply(intensity[:, None], scale, out=colors)
+    return colors
+
+def _fill_columns(out: np.ndarray, x, y, z):
+    """Interleave three per-axis arrays into the columns of an (N, 3) buffer."""
+    out[:, 0] = x
+    out[:, 1] = y
+    out[:, 2] = z
+
+# Bytes read when looking for the end of a PLY/PCD header
+_HEADER_PROBE_BYTES = 65536
+
+# PLY scalar property types -> numpy type codes
+_PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8'
+}
+
+class BinaryHeader(NamedTuple):
+    """Layout of the fixed-size point records in a binary PLY/PCD/XYZBIN file."""
+    dtype: np.dtype
+    count: int
+    offset: int
+    # Added back to x/y/z; .xyzbin stores coordinates relative to it
+    origin: Optional[np.ndarray] = None
+
+def _parse_ply_header(head: bytes) -> Optional[BinaryHeader]:
+    """
+    Parse a binary PLY header.
+    
+    Returns None unless the vertex element comes first and has only scalar
+    properties, i.e. the vertex block is an array of fixed-size records, and
+    any red/green/blue properties are 8-bit as the record readers assume.
+    """
+    end = head.find(b'end_header')
+    if not head.startswith(b'ply') or end < 0:
+        return None
+    offset = head.index(b'\n', end) + 1
+    
+    byte_order = None
+    vertex_count = None
+    fields = []
+    element = None
+    for line in head[:end].decode('ascii', 'replace').splitlines():
+        tokens = line.split()
+        if not tokens:
+            continue
+        if tokens[0] == 'format':
+            byte_order = {'binary_little_endian': '<', 'binary_big_endian': '>'}.get(tokens[1])
+        elif tokens[0] == 'element':
+            if element is None and tokens[1] != 'vertex':
+                return None
+            element = tokens[1]
+            if element == 'vertex':
+                vertex_count = int(tokens[2])
+        elif tokens[0] == 'property' and element == 'vertex':
+            if tokens[1] == 'list' or tokens[1] not in _PLY_TYPES:
+                return None
+            if tokens[2] in ('red', 'green', 'blue') and _PLY_TYPES[tokens[1]] != 'u1':
+                return None
+            fields.append((tokens[2], _PLY_TYPES[tokens[1]]))
+    
+    if byte_order is None or vertex_count is None or not fields:
+        return None
+    dtype = np.dtype([(name, byte_order + code) for name, code in fields])
+    return BinaryHeader(dtype, vertex_count, offset)
+
+def _parse_pcd_header(head: bytes) -> Optional[BinaryHeader]:
+    """Parse a PCD header; returns None unless the data section is plain binary."""
+    values = {}
+    offset = 0
+    for raw_line in head.split(b'\n'):
+        offset += len(raw_line) + 1
+        tokens = raw_line.decode('ascii', 'replace').split()
+        if not tokens or tokens[0].startswith('#'):
+            continue
+        values[tokens[0].upper()] = tokens[1:]
+        if tokens[0].upper() == 'DATA':
+            break
+    else:
+        return None
+    
+    if values['DATA'] != ['binary'] or not {'FIELDS', 'SIZE', 'TYPE', 'POINTS'} <= values.keys():
+        return None
+    counts = values.get('COUNT', ['1'] * len(values['FIELDS']))
+    
+    fields = []
+    for i, (name, size, kind, count) in enumerate(
+            zip(values['FIELDS'], values['SIZE'], values['TYPE'], counts)):
+        # '_' marks padding and may repeat; give each one a unique name
+        name = f'_pad{i}' if name == '_' else name
+        code = '<' + {'F': 'f', 'I': 'i', 'U': 'u'}[kind.upper()] + size
+        fields.append((name, code) if count == '1' else (name, code, (int(count),)))
+    
+    return BinaryHeader(np.dtype(fields), int(values['POINTS'][0]), offset)
+
+def _read_xyzbin_header(filepath: Path) -> BinaryHeader:
+    """Record layout and origin of a .xyzbin file, from its JSON header when present."""
+    header_file = xyzbin_header_path(filepath)
+    if header_file.exists():
+        with open(header_file, 'r') as f:
+            header = json.load(f)
+    else:
+        header = {'dtype': '<f4', 'columns': ['x', 'y', 'z']}
+    
+    dtype = np.dtype([(column, header['dtype']) for column in header['columns']])
+    count = filepath.stat().st_size // dtype.itemsize
+    # Version 1 files have no offset and hold absolute coordinates
+    origin = np.asarray(header.get('offset', (0.0, 0.0, 0.0)), dtype=np.float64)
+    return BinaryHeader(dtype, count, 0, origin)
+
+def _read_binary_header(filepath: Path) -> Optional[BinaryHeader]:
+    """Read the record layout of a binary PLY/PCD/XYZBIN file, or None if unsupported."""
+    suffix = filepath.suffix.lower()
+    if suffix == '.xyzbin':
+        return _read_xyzbin_header(filepath)
+    
+    with open(filepath, 'rb') as f:
+        head = f.read(_HEADER_PROBE_BYTES)
+    
+    try:
+        if suffix == '.ply':
+            return _parse_ply_header(head)
+        return _parse_pcd_header(head)
+    except (ValueError, KeyError, IndexError):
+        return None
+
+def _load_binary_mmap(filepath: Path, header: BinaryHeader) -> np.ndarray:
+    """
+    Map the point records of a binary file as a read-only structured array.
+    
+    The array is backed directly by the page cache - no read() copies - and
+    keeps the mapping alive for as long as it is referenced. Records are
+    read front to back, so the kernel is told to read ahead.
+    """
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        # The mapping holds its own reference to the file
+        os.close(fd)
+    
+    if hasattr(mapping, 'madvise'):
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    
+    return np.frombuffer(mapping, dtype=header.dtype, count=header.count, offset=header.offset)
+
+def _can_mmap(filepath: Path) -> bool:
+    """32-bit interpreters cannot map files beyond their ~2 GiB address space."""
+    return sys.maxsize > 2**32 or filepath.stat().st_size < 2**31
+
+def _record_columns(records: np.ndarray, names) -> Optional[np.ndarray]:
+    """Copy three record fields into a contiguous (N, 3) float64 array, if present."""
+    if not all(name in records.dtype.names for name in names):
+        return None
+    out = np.empty((len(records), 3), dtype=np.float64)
+    _fill_columns(out, *(records[name] for name in names))
+    return out
+
+def _unpack_pcd_rgb(packed: np.ndarray) -> np.ndarray:
+    """Decode PCD's packed 0x00RRGGBB 'rgb' field to (N, 3) colors in [0, 1]."""
+    bits = np.ascontiguousarray(packed).view(np.uint32)
+    colors = np.empty((len(bits), 3), dtype=np.float64)
+    _fill_columns(colors, (bits >> 16) & 0xFF, (bits >> 8) & 0xFF, bits & 0xFF)
+    colors *= 1 / 255.0
+    return colors
+
+def _decode_las_range(filepath: Path,
+                      start: int,
+                      stop: int,
+                      points: np.ndarray,
+                      colors: Optional[np.ndarray],
+                      intensity: Optional[np.ndarray]) -> int:
+    """
+    Decode points [start, stop) of a LAS/LAZ file into preallocated buffers.
+    
+    Returns the number of points actually read, which is short when the
+    header overstates the point count.
+    """
+    with laspy.open(filepath) as las_reader:
+        if start:
+            las_reader.seek(start)
+        
+        offset = start
+        while offset < stop:
+            chunk = las_reader.read_points(min(_LAS_CHUNK_POINTS, stop - offset))
+            if len(chunk) == 0:
+                break
+            end = offset + len(chunk)
+            _fill_columns(points[offset:end], chunk.x, chunk.y, chunk.z)
+            if colors is not None:
+                _fill_columns(colors[offset:end], chunk.red, chunk.green, chunk.blue)
+            elif intensity is not None:
+                intensity[offset:end] = chunk.intensity
+            offset = end
+    
+    return offset - start
+
+def _chunk_dtype(has_colors: bool, has_intensity: bool = False) -> np.dtype:
+    """Record layout of the chunks yielded by PointCloudLoader.load_chunks."""
+    fields = [('x', '<f8'), ('y', '<f8'), ('z', '<f8')]
+    if has_colors:
+        fields += [('r', 'u1'), ('g', 'u1'), ('b', 'u1')]
+    if has_intensity:
+        fields += [('i', '<u2')]
+    return np.dtype(fields)
+
+# Suffix -> PointCloudLoader reader method. Formats whose library is not
+# installed are left out, so they fail in load() instead of at import.
+_READERS: Dict[str, str] = {
+    '.e57': '_load_e57_format',
+}
+
+if HAS_OPEN3D:
+    _READERS.update({
+        '.ply': '_load_open3d_format',
+        '.pcd': '_load_open3d_format',
+        '.pts': '_load_pts_format',
+        '.xyzbin': '_load_xyzbin_format',
+    })
+
+# laspy decodes LAS/LAZ, but load() still returns an Open3D cloud
+if HAS_LASPY and HAS_OPEN3D:
+    _READERS.update({
+        '.las': '_load_las_format',
+        '.laz': '_load_las_format',
+    })
+
+# setup.py extra providing each format's reader
+_FORMAT_EXTRAS = {
+    '.ply': 'ply', '.pcd': 'ply', '.pts': 'ply', '.xyzbin': 'ply',
+    '.las': 'las,ply', '.laz': 'las,ply',
+    '.e57': 'e57',
+}
+
+def _missing_reader_error(suffix: str) -> ImportError:
+    """ImportError telling the user which extra adds support for a format."""
+    return ImportError(f"{suffix} support is not installed. "
+                       f"Install it with: pip install cloudforge[{_FORMAT_EXTRAS[suffix]}]")
+
+# Formats that load() can memory-map when asked to
+_MMAP_FORMATS = frozenset({'.ply', '.pcd'})
+# Formats whose reader can decode on several threads
+_THREADED_FORMATS = frozenset({'.las', '.laz'})
 
 @track_usage("cloudforge.io.loader")
 class PointCloudLoader:
@@ -24,17 +296,20 @@ class PointCloudLoader:
     Auto-detects format and handles edge cases.
     """
     
-    supported_formats = ['.ply', '.pcd', '.las', '.laz', '.e57', '.pts']
+    supported_formats = ['.ply', '.pcd', '.las', '.laz', '.e57', '.pts', '.xyzbin']
     
     def __init__(self):
         self.last_loaded_info = {}
     
-    def load(self, filepath: Union[str, Path]):
+    def load(self, filepath: Union[str, Path], use_mmap: bool = False, jobs: int = 1):
         """
         Load point cloud from file with automatic format detection.
         
         Args:
             filepath: Path to the point cloud file
+            use_mmap: Memory-map binary PLY/PCD files instead of reading them
+                through Open3D; other layouts fall back to the regular reader
+            jobs: Threads decoding LAS/LAZ point ranges; ignored for other formats
             
         Returns:
             Point cloud object or None if loading failed
@@ -49,18 +324,234 @@ class PointCloudLoader:
         if suffix not in self.supported_formats:
             raise ValueError(f"Unsupported format: {suffix}. Supported: {self.supported_formats}")
         
+        reader = _READERS.get(suffix)
+        if reader is None:
+            raise _missing_reader_error(suffix)
+        
         try:
-            if suffix in ['.ply', '.pcd']:
-                return self._load_open3d_format(filepath)
-            elif suffix in ['.las', '.laz']:
-                return self._load_las_format(filepath)
-            elif suffix == '.e57':
-                return self._load_e57_format(filepath)
-            elif suffix == '.pts':
-                return self._load_pts_format(filepath)
+            if use_mmap and suffix in _MMAP_FORMATS and _can_mmap(filepath):
+                header = _read_binary_header(filepath)
+                if header is not None:
+                    return self._load_mmap_format(filepath, header)
+            if jobs > 1 and suffix in _THREADED_FORMATS:
+                return getattr(self, reader)(filepath, jobs=jobs)
+            return getattr(self, reader)(filepath)
         except Exception as e:
             raise RuntimeError(f"Failed to load {filepath}: {str(e)}")
     
+    def load_chunks(self, 
+                    filepath: Union[str, Path], 
+                    chunk_points: int = _DEFAULT_CHUNK_POINTS, 
+                    gray_intensity: bool = False, 
+                    use_mmap: bool = True) -> Iterator[np.ndarray]:
+        """
+        Stream a point cloud as structured chunks of at most chunk_points records.
+        
+        Chunks have x/y/z float64 fields, plus r/g/b uint8 fields when the
+        source has RGB colors and an 'i' uint16 field for LAS intensity. LAS/LAZ files, and
+        binary PLY/PCD/XYZBIN files when use_mmap is set, are decoded one chunk
+        at a time, so memory stays O(chunk_points); other inputs are loaded
+        whole with load() and then sliced.
+        
+        With gray_intensity, LAS files without RGB get gray r/g/b fields
+        from intensity, as load() does. Normalizing needs the global maximum,
+        so this costs an extra decoding pass over the file.
+        
+        The header is read eagerly: get_load_info() describes the source as
+        soon as this returns, before the first chunk is consumed.
+        
+        Args:
+            filepath: Path to the point cloud file
+            chunk_points: Maximum number of points per chunk
+            gray_intensity: Derive gray colors from LAS intensity
+            use_mmap: Memory-map binary PLY/PCD/XYZBIN files
+            
+        Returns:
+            Iterator over structured point arrays
+        """
+        filepath = Path(filepath)
+        
+        if not filepath.exists():
+            raise FileNotFoundError(f"Point cloud file not found: {filepath}")
+        
+        suffix = filepath.suffix.lower()
+        
+        if suffix not in self.supported_formats:
+            raise ValueError(f"Unsupported format: {suffix}. Supported: {self.supported_formats}")
+        
+        if suffix in ['.las', '.laz']:
+            if not HAS_LASPY:
+                raise _missing_reader_error(suffix)
+            with laspy.open(filepath) as las_reader:
+                header = las_reader.header
+            dimensions = set(header.point_format.dimension_names)
+            has_rgb = {'red', 'green', 'blue'} <= dimensions
+            has_intensity = 'intensity' in dimensions
+            gray_peak = None
+            if gray_intensity and has_intensity and not has_rgb:
+                gray_peak = self._las_intensity_peak(filepath, chunk_points)
+            self.last_loaded_info = {
+                'format': filepath.suffix,
+                'points': header.point_count,
+                'has_colors': has_rgb or gray_peak is not None,
+                'has_intensity': has_intensity,
+                'las_version': f"{header.version.major}.{header.version.minor}"
+            }
+            return self._las_chunks(filepath, chunk_points, has_rgb, has_intensity, gray_peak)
+        
+        if use_mmap and suffix in ['.ply', '.pcd', '.xyzbin'] and _can_mmap(filepath):
+            header = _read_binary_header(filepath)
+            if header is not None:
+                records = _load_binary_mmap(filepath, header)
+                names = records.dtype.names
+                has_colors = {'red', 'green', 'blue'} <= set(names) or 'rgb' in names
+                self.last_loaded_info = {
+                    'format': filepath.suffix,
+                    'points': len(records),
+                    'has_colors': has_colors,
+                    'has_normals': 'nx' in names or 'normal_x' in names,
+                    'memory_mapped': True
+                }
+                return self._record_chunks(records, chunk_points, has_colors, header.origin)
+        
+        return self._loaded_chunks(self.load(filepath), chunk_points)
+    
+    def load_array(self, 
+                   filepath: Union[str, Path], 
+                   float64: bool = False, 
+                   chunk_points: int = _DEFAULT_CHUNK_POINTS) -> PointCloudArray:
+        """
+        Load a point cloud into one structured array of point records.
+        
+        Records hold xyz, 8-bit RGB and 16-bit intensity (see point_record),
+        filled chunk by chunk from load_chunks without an intermediate copy
+        of the whole cloud. In float32 mode coordinates are stored relative
+        to an origin near the first point, which keeps millimeter precision
+        for clouds spanning tens of kilometers.
+        
+        Args:
+            filepath: Path to the point cloud file
+            float64: Store absolute float64 coordinates instead
+            chunk_points: Points decoded per chunk
+            
+        Returns:
+            PointCloudArray over the loaded records
+        """
+        chunks = self.load_chunks(filepath, chunk_points)
+        info = self.get_load_info()
+        records = np.zeros(info['points'], dtype=point_dtype(float64))
+        origin = None
+        offset = 0
+        
+        for chunk in chunks:
+            if not len(chunk):
+                continue
+            if origin is None:
+                first = np.array([chunk['x'][0], chunk['y'][0], chunk['z'][0]])
+                origin = np.zeros(3) if float64 else np.floor(first)
+            
+            end = offset + len(chunk)
+            out = records[offset:end]
+            xyz = out['xyz']
+            for k, field in enumerate(('x', 'y', 'z')):
+                np.subtract(chunk[field], origin[k], out=xyz[:, k], casting='same_kind')
+            
+            names = chunk.dtype.names
+            if 'r' in names:
+                for field in ('r', 'g', 'b'):
+                    out[field] = chunk[field]
+            if 'i' in names:
+                out['i'] = chunk['i']
+            offset = end
+        
+        return PointCloudArray(records[:offset], origin, info)
+    
+    def _las_chunks(self, 
+                    filepath: Path, 
+                    chunk_points: int, 
+                    has_rgb: bool, 
+                    has_intensity: bool, 
+                    gray_peak: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Decode LAS/LAZ points chunk by chunk with laspy.
+        
+        When gray_peak is given, r/g/b are filled with intensity scaled by it,
+        matching the gray colors of _intensity_to_gray.
+        """
+        dtype = _chunk_dtype(has_rgb or gray_peak is not None, has_intensity)
+        # Same arithmetic as _intensity_to_gray followed by the 0-255 export scaling
+        gray_scale = np.float64(1.0 / gray_peak) if gray_peak else np.float64(0.0)
+        with laspy.open(filepath) as las_reader:
+            for las_chunk in las_reader.chunk_iterator(chunk_points):
+                chunk = np.empty(len(las_chunk), dtype=dtype)
+                chunk['x'] = las_chunk.x
+                chunk['y'] = las_chunk.y
+                chunk['z'] = las_chunk.z
+                if has_rgb:
+                    # LAS stores 16-bit color channels
+                    chunk['r'] = las_chunk.red >> 8
+                    chunk['g'] = las_chunk.green >> 8
+                    chunk['b'] = las_chunk.blue >> 8
+                if has_intensity:
+                    chunk['i'] = las_chunk.intensity
+                if gray_peak is not None:
+                    gray = np.multiply(chunk['i'], gray_scale) * 255
+                    chunk['r'] = gray
+                    chunk['g'] = gray
+                    chunk['b'] = gray
+                yield chunk
+    
+    def _las_intensity_peak(self, filepath: Path, chunk_points: int) -> int:
+        """Maximum LAS intensity, found with a streaming pass over the file."""
+        peak = 0
+        with laspy.open(filepath) as las_reader:
+            for las_chunk in las_reader.chunk_iterator(chunk_points):
+                if len(las_chunk):
+                    peak = max(peak, int(np.max(las_chunk.intensity)))
+        return peak
+    
+    def _record_chunks(self, 
+                       records: np.ndarray, 
+                       chunk_points: int, 
+                       has_colors: bool, 
+                       origin: Optional[np.ndarray] = None) -> Iterator[np.ndarray]:
+        """Copy memory-mapped binary records out chunk by chunk."""
+        dtype = _chunk_dtype(has_colors)
+        for start in range(0, len(records), chunk_points):
+            block = records[start:start + chunk_points]
+            chunk = np.empty(len(block), dtype=dtype)
+            for i, field in enumerate(('x', 'y', 'z')):
+                chunk[field] = block[field]
+                if origin is not None:
+                    chunk[field] += origin[i]
+            if has_colors:
+                if 'rgb' in block.dtype.names:
+                    # PCD packs colors as 0x00RRGGBB in a float32 field
+                    bits = np.ascontiguousarray(block['rgb']).view(np.uint32)
+                    chunk['r'] = bits >> 16
+                    chunk['g'] = bits >> 8
+                    chunk['b'] = bits
+                else:
+                    chunk['r'] = block['red']
+                    chunk['g'] = block['green']
+                    chunk['b'] = block['blue']
+            yield chunk
+    
+    def _loaded_chunks(self, pcd, chunk_points: int) -> Iterator[np.ndarray]:
+        """Slice an already loaded point cloud into chunks."""
+        points = np.asarray(pcd.points)
+        colors = np.asarray(pcd.colors) if len(pcd.colors) > 0 else None
+        dtype = _chunk_dtype(colors is not None)
+        for start in range(0, len(points), chunk_points):
+            stop = start + chunk_points
+            chunk = np.empty(len(points[start:stop]), dtype=dtype)
+            for i, field in enumerate(('x', 'y', 'z')):
+                chunk[field] = points[start:stop, i]
+            if colors is not None:
+                for i, field in enumerate(('r', 'g', 'b')):
+                    chunk[field] = colors[start:stop, i] * 255
+            yield chunk
+    
     def _load_open3d_format(self, filepath: Path):
         """Load PLY or PCD files using Open3D."""
         pcd = o3d.io.read_point_cloud(str(filepath))
@@ -77,32 +568,106 @@ class PointCloudLoader:
         
         return pcd
     
-    def _load_las_format(self, filepath: Path):
-        """Load LAS/LAZ files using laspy."""
-        las_file = laspy.read(filepath)
+    def _load_mmap_format(self, filepath: Path, header: BinaryHeader):
+        """Load binary PLY or PCD point records through a memory mapping."""
+        records = _load_binary_mmap(filepath, header)
         
-        # Extract XYZ coordinates
-        points = np.vstack([las_file.x, las_file.y, las_file.z]).T
+        points = _record_columns(records, ('x', 'y', 'z'))
+        if points is None or len(points) == 0:
+            raise ValueError(f"No points found in {filepath}")
+        
+        pcd = o3d.geometry.PointCloud()
+        pcd.points = o3d.utility.Vector3dVector(points)
+        
+        colors = _record_columns(records, ('red', 'green', 'blue'))
+        if colors is not None:
+            colors *= 1 / 255.0
+        elif 'rgb' in records.dtype.names:
+            colors = _unpack_pcd_rgb(records['rgb'])
+        if colors is not None:
+            pcd.colors = o3d.utility.Vector3dVector(colors)
+        
+        normals = _record_columns(records, ('nx', 'ny', 'nz'))
+        if normals is None:
+            normals = _record_columns(records, ('normal_x', 'normal_y', 'normal_z'))
+        if normals is not None:
+            pcd.normals = o3d.utility.Vector3dVector(normals)
+        
+        self.last_loaded_info = {
+            'format': filepath.suffix,
+            'points': len(points),
+            'has_colors': len(pcd.colors) > 0,
+            'has_normals': len(pcd.normals) > 0,
+            'memory_mapped': True
+        }
+        
+        return pcd
+    
+    def _load_las_format(self, filepath: Path, jobs: int = 1):
+        """
+        Load LAS/LAZ files using laspy, streaming points chunk by chunk.
+        
+        With jobs > 1 the point range is split evenly and each slice is
+        decoded on its own thread through a separate reader; laspy's numpy
+        scaling and the LAZ backends spend most of their time outside the GIL.
+        """
+        with laspy.open(filepath) as las_reader:
+            header = las_reader.header
+        
+        dimensions = set(header.point_format.dimension_names)
+        has_rgb = {'red', 'green', 'blue'} <= dimensions
+        has_intensity = 'intensity' in dimensions
+        
+        # Preallocate the outputs and fill them in place, so peak memory
+        # is the final arrays plus one decoded chunk per thread
+        n = header.point_count
+        points = np.empty((n, 3), dtype=np.float64)
+        colors = np.empty((n, 3), dtype=np.float64) if has_rgb else None
+        intensity = np.empty(n, dtype=np.uint16) if has_intensity and not has_rgb else None
+        
+        # Small files are not worth a thread per slice
+        jobs = max(1, min(jobs, -(-n // _LAS_CHUNK_POINTS)))
+        bounds = [n * k // jobs for k in range(jobs + 1)]
+        ranges = list(zip(bounds[:-1], bounds[1:]))
+        
+        def decode(span):
+            return _decode_las_range(filepath, span[0], span[1], points, colors, intensity)
+        
+        if jobs == 1:
+            counts = [decode(ranges[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                counts = list(executor.map(decode, ranges))
+        
+        # Keep the contiguous decoded prefix
+        offset = 0
+        for (start, stop), count in zip(ranges, counts):
+            offset = start + count
+            if count < stop - start:
+                break
+        
+        # Guard against headers that overstate the point count
+        points = points[:offset]
         
         pcd = o3d.geometry.PointCloud()
         pcd.points = o3d.utility.Vector3dVector(points)
         
         # Add colors if available (RGB or intensity)
-        if hasattr(las_file, 'red') and hasattr(las_file, 'green') and hasattr(las_file, 'blue'):
-            colors = np.vstack([las_file.red, las_file.green, las_file.blue]).T / 65535.0
+        if colors is not None:
+            colors = colors[:offset]
+            colors *= 1 / 65535.0
             pcd.colors = o3d.utility.Vector3dVector(colors)
-        elif hasattr(las_file, 'intensity'):
+        elif intensity is not None:
             # Convert intensity to grayscale colors
-            intensity_norm = las_file.intensity / np.max(las_file.intensity)
-            colors = np.column_stack([intensity_norm, intensity_norm, intensity_norm])
+            colors = _intensity_to_gray(intensity[:offset])
             pcd.colors = o3d.utility.Vector3dVector(colors)
         
         self.last_loaded_info = {
             'format': filepath.suffix,
             'points': len(points),
             'has_colors': len(pcd.colors) > 0,
-            'has_intensity': hasattr(las_file, 'intensity'),
-            'las_version': f"{las_file.header.version_major}.{las_file.header.version_minor}"
+            'has_intensity': has_intensity,
+            'las_version': f"{header.version.major}.{header.version.minor}"
         }
         
         return pcd
@@ -115,7 +680,12 @@ class PointCloudLoader:
     def _load_pts_format(self, filepath: Path):
         """Load simple PTS text files (X Y Z [I] [R G B])."""
         try:
-            data = np.loadtxt(filepath)
+            if HAS_PANDAS:
+                # pandas' C tokenizer is far faster than np.loadtxt on large files
+                data = pd.read_csv(filepath, sep=r'\s+', header=None, comment='#',
+                                   engine='c', dtype=np.float64).to_numpy()
+            else:
+                data = np.loadtxt(filepath, ndmin=2)
         except Exception as e:
             raise ValueError(f"Could not parse PTS file: {e}")
         
@@ -128,9 +698,7 @@ class PointCloudLoader:
         
         # Handle intensity and/or colors
         if data.shape[1] == 4:  # X Y Z I
-            intensity = data[:, 3]
-            intensity_norm = intensity / np.max(intensity)
-            colors = np.column_stack([intensity_norm, intensity_norm, intensity_norm])
+            colors = _intensity_to_gray(data[:, 3])
             pcd.colors = o3d.utility.Vector3dVector(colors)
         elif data.shape[1] >= 6:  # X Y Z R G B or X Y Z I R G B
             color_start = 3 if data.shape[1] == 6 else 4
@@ -149,6 +717,27 @@ class PointCloudLoader:
         
         return pcd
     
-    def get_load_info(self) -> dict:
-        """Get information about the last loaded point cloud."""
-        return self.last_loaded_info.copy()
\ No newline at end of file
+    def _load_xyzbin_format(self, filepath: Path):
+        """Load raw binary XYZ files written by PointCloudExporter."""
+        header = _read_xyzbin_header(filepath)
+        records = np.fromfile(filepath, dtype=header.dtype, count=header.count)
+        points = _record_columns(records, ('x', 'y', 'z'))
+        points += header.origin
+        
+        if len(points) == 0:
+            raise ValueError(f"No points found in {filepath}")
+        
+        pcd = o3d.geometry.PointCloud()
+        pcd.points = o3d.utility.Vector3dVector(points)
+        
+        self.last_loaded_info = {
+            'format': filepath.suffix,
+            'points': len(points),
+            'has_colors': False
+        }
+        
+        return pcd
+    
+    def get_load_info(self) -> Mapping[str, Any]:
+        """Get a read-only view of information about the last loaded point cloud."""
+        return types.MappingProxyType(self.last_loaded_info)
\ No newline at end of file
@@ -0,0 +1,61 @@
+import types
+from typing import Any, Mapping, Optional, Tuple
+import numpy as np
+from ..utils.stats import bbox
+
+# Point records: coordinates as one (3,) subarray field so `.xyz` is a view,
+# 8-bit RGB and 16-bit intensity. Aligned, not packed: 20 bytes per point at
+# float32 instead of 17, but `.xyz` stays an aligned view that the numba
+# bbox kernel can read without a copy.
+POINT_DTYPE_F32 = np.dtype([
+    ('xyz', '<f4', (3,)),
+    ('r', 'u1'), ('g', 'u1'), ('b', 'u1'),
+    ('i', '<u2')
+], align=True)
+POINT_DTYPE_F64 = np.dtype([
+    ('xyz', '<f8', (3,)),
+    ('r', 'u1'), ('g', 'u1'), ('b', 'u1'),
+    ('i', '<u2')
+], align=True)
+
+def point_dtype(float64: bool = False) -> np.dtype:
+    """Record dtype for the requested coordinate precision."""
+    return POINT_DTYPE_F64 if float64 else POINT_DTYPE_F32
+
+class PointCloudArray:
+    """
+    Point cloud held as a single structured array of point records.
+    
+    Coordinates are stored relative to `origin` (kept in float64), like the
+    scale/offset scheme of LAS files. Georeferenced coordinates in the
+    millions of meters would otherwise lose sub-meter precision in float32.
+    """
+    
+    def __init__(self,
+                 records: np.ndarray,
+                 origin: Optional[np.ndarray] = None,
+                 info: Optional[Mapping[str, Any]] = None):
+        self.records = records
+        self.origin = np.zeros(3) if origin is None else np.asarray(origin, dtype=np.float64)
+        self.info = types.MappingProxyType(dict(info or {}))
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    @property
+    def xyz(self) -> np.ndarray:
+        """(N, 3) view of the origin-relative coordinates; no copy."""
+        return self.records['xyz']
+    
+    @property
+    def has_colors(self) -> bool:
+        return bool(self.info.get('has_colors'))
+    
+    @property
+    def has_intensity(self) -> bool:
+        return bool(self.info.get('has_intensity'))
+    
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Absolute (min, max) corners of the cloud in float64."""
+        mn, mx = bbox(self.xyz)
+        return mn.astype(np.float64) + self.origin, mx.astype(np.float64) + self.origin
@@ -1,72 +1,89 @@
+import os
+import sys
 import time
+import types
 import functools
-from typing import Dict, Any, Callable
+import threading
+from typing import Dict, Any, Callable, Mapping
 from tqdm import tqdm
 
+# Usage tracking is opt-in; when off, @track_usage returns functions untouched
+_TRACK_USAGE = os.environ.get('CLOUDFORGE_TRACK_USAGE') == '1'
+
 # Global usage tracking
 _usage_stats: Dict[str, Dict[str, Any]] = {}
+_usage_locks: Dict[str, threading.Lock] = {}
+
+def _new_stats() -> Dict[str, Any]:
+    """Create an empty statistics record for one operation."""
+    return {
+        'call_count': 0,
+        'total_time_ns': 0,
+        'success_count': 0,
+        'error_count': 0,
+        'last_called': None,
+        'errors': []
+    }
 
 def track_usage(operation_name: str):
     """
     Decorator to track usage statistics for CloudForge operations.
     
+    Tracking is only active when CLOUDFORGE_TRACK_USAGE=1 is set at import
+    time; otherwise the decorated function is returned unchanged.
+    
     Args:
         operation_name: Unique identifier for the operation
     """
     def decorator(func: Callable) -> Callable:
+        if not _TRACK_USAGE:
+            return func
+        
+        # Bind the stats record once so calls skip the registry lookup
+        stats = _usage_stats.setdefault(operation_name, _new_stats())
+        lock = _usage_locks.setdefault(operation_name, threading.Lock())
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             try:
                 result = func(*args, **kwargs)
-                success = True
-                error = None
             except Exception as e:
-                result = None
-                success = False
-                error = str(e)
-                raise
-            finally:
-                end_time = time.time()
-                duration = end_time - start_time
-                
-                # Record usage statistics
-                if operation_name not in _usage_stats:
-                    _usage_stats[operation_name] = {
-                        'call_count': 0,
-                        'total_time': 0.0,
-                        'avg_time': 0.0,
-                        'success_count': 0,
-                        'error_count': 0,
-                        'last_called': None,
-                        'errors': []
-                    }
-                
-                stats = _usage_stats[operation_name]
-                stats['call_count'] += 1
-                stats['total_time'] += duration
-                stats['avg_time'] = stats['total_time'] / stats['call_count']
-                stats['last_called'] = time.time()
-                
-                if success:
-                    stats['success_count'] += 1
-                else:
+                error = {
+                    'error': str(e),
+                    'timestamp': time.time(),
+                    'args': str(args)[:100],  # Truncate long args
+                    'kwargs': str(kwargs)[:100]
+                }
+                with lock:
                     stats['error_count'] += 1
-                    stats['errors'].append({
-                        'error': error,
-                        'timestamp': time.time(),
-                        'args': str(args)[:100],  # Truncate long args
-                        'kwargs': str(kwargs)[:100]
-                    })
+                    errors = stats['errors']
+                    errors.append(error)
                     # Keep only last 10 errors
-                    if len(stats['errors']) > 10:
-                        stats['errors'] = stats['errors'][-10:]
+                    if len(errors) > 10:
+                        del errors[:-10]
+                raise
+            else:
+                with lock:
+                    stats['success_count'] += 1
+            finally:
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                with lock:
+                    stats['total_time_ns'] += elapsed_ns
+                    stats['call_count'] += 1
+                    stats['last_called'] = time.time()
             
             return result
         return wrapper
     return decorator
 
+def _progress_bars_enabled() -> bool:
+    """Draw progress bars only on an interactive terminal, unless disabled."""
+    if os.environ.get('CLOUDFORGE_NO_PROGRESS'):
+        return False
+    return sys.stderr is not None and sys.stderr.isatty()
+
 class ProgressTracker:
     """
     Enhanced progress tracking with context management and nested progress bars.
@@ -82,12 +99,15 @@ class ProgressTracker:
     
     def __enter__(self):
         self.start_time = time.time()
-        self.pbar = tqdm(
-            total=self.total,
-            desc=self.description,
-            unit=" points" if "point" in self.description.lower() else " items",
-            ncols=80
-        )
+        # Piped/CI runs only count progress; no bar is rendered
+        if _progress_bars_enabled():
+            self.pbar = tqdm(
+                total=self.total,
+                desc=self.description,
+                unit=" points" if "point" in self.description.lower() else " items",
+                ncols=80,
+                mininterval=0.5
+            )
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -102,7 +122,7 @@ class ProgressTracker:
     
     def update(self, amount: int = 1, description: str = None):
         """Update progress by specified amount."""
-        if self.pbar:
+        if self.pbar is not None:
             self.pbar.update(amount)
             if description:
                 self.pbar.set_description(description)
@@ -110,7 +130,7 @@ class ProgressTracker:
     
     def set_progress(self, current: int, description: str = None):
         """Set absolute progress value."""
-        if self.pbar:
+        if self.pbar is not None:
             delta = current - self.current
             self.pbar.update(delta)
             if description:
@@ -132,13 +152,16 @@ class ProgressTracker:
         self.current = 0
         if self.pbar:
             self.pbar.close()
-        self.pbar = tqdm(
-            total=total,
-            desc=description,
-            unit=" items",
-            ncols=80,
-            leave=False
-        )
+        self.pbar = None
+        if _progress_bars_enabled():
+            self.pbar = tqdm(
+                total=total,
+                desc=description,
+                unit=" items",
+                ncols=80,
+                leave=False,
+                mininterval=0.5
+            )
     
     def pop_context(self):
         """Return to previous progress context."""
@@ -156,27 +179,79 @@ class ProgressTracker:
         self.current = context['current']
         self.pbar = context['pbar']
 
-def get_usage_stats() -> Dict[str, Dict[str, Any]]:
-    """Get all recorded usage statistics."""
-    return _usage_stats.copy()
+class NullProgressTracker:
+    """
+    Drop-in ProgressTracker replacement that does nothing.
+    
+    Used for scripted runs where nobody watches the bar: no tqdm instance,
+    no timing and no completion message.
+    """
+    
+    def __init__(self, description: str = "Processing", total: int = 100):
+        self.description = description
+        self.total = total
+        self.current = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    def update(self, amount: int = 1, description: str = None):
+        pass
+    
+    def set_progress(self, current: int, description: str = None):
+        pass
+    
+    def push_context(self, description: str, total: int = 100):
+        pass
+    
+    def pop_context(self):
+        pass
+
+def progress(description: str, total: int = 100, enabled: bool = True):
+    """
+    Create a progress tracker, or a no-op one when progress is not shown.
+    
+    Args:
+        description: Label for the progress bar
+        total: Total units of work
+        enabled: False forces the no-op tracker, e.g. for a --progress-off flag
+    
+    Returns:
+        ProgressTracker on an interactive terminal, otherwise NullProgressTracker
+    """
+    if enabled and _progress_bars_enabled():
+        return ProgressTracker(description, total)
+    return NullProgressTracker(description, total)
+
+def get_usage_stats() -> Mapping[str, Dict[str, Any]]:
+    """Get a read-only view of all recorded usage statistics."""
+    return types.MappingProxyType(_usage_stats)
 
 def print_usage_report():
     """Print a formatted report of all usage statistics."""
-    if not _usage_stats:
+    # Decorated operations are registered up front; report only those called
+    called = {op: stats for op, stats in _usage_stats.items() if stats['call_count']}
+    if not called:
         print("No usage statistics recorded yet.")
+        if not _TRACK_USAGE:
+            print("Set CLOUDFORGE_TRACK_USAGE=1 to enable usage tracking.")
         return
     
     print("\n🔍 CloudForge Usage Statistics")
     print("=" * 50)
     
-    for operation, stats in _usage_stats.items():
+    for operation, stats in called.items():
         success_rate = (stats['success_count'] / stats['call_count']) * 100
+        total_time = stats['total_time_ns'] / 1e9
         
         print(f"\n📊 {operation}")
         print(f"   Calls: {stats['call_count']}")
         print(f"   Success Rate: {success_rate:.1f}%")
-        print(f"   Avg Time: {stats['avg_time']:.3f}s")
-        print(f"   Total Time: {stats['total_time']:.3f}s")
+        print(f"   Avg Time: {total_time / stats['call_count']:.3f}s")
+        print(f"   Total Time: {total_time:.3f}s")
         
         if stats['error_count'] > 0:
             print(f"   Recent Errors: {len(stats['errors'])}")
@@ -185,8 +260,10 @@ def print_usage_report():
 
 def reset_usage_stats():
     """Clear all usage statistics."""
-    global _usage_stats
-    _usage_stats.clear()
+    # Reset in place: decorated wrappers hold references to these records
+    for operation, stats in _usage_stats.items():
+        with _usage_locks[operation]:
+            stats.update(_new_stats())
 
 # Convenience functions for common operations
 def create_progress_bar(description: str, total: int) -> ProgressTracker:
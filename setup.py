@@ -12,16 +12,17 @@ setup(
         "pydantic>=2.0.0",
         "tqdm>=4.64.0",
         "numpy>=1.21.0",
-        "pathlib2>=2.3.7",
-        # Optional dependencies
-        "open3d>=0.17.0",  # For PLY/PCD support
-        "laspy>=2.0.0",    # For LAS/LAZ support
     ],
     extras_require={
+        "ply": ["open3d>=0.17.0"],  # PLY/PCD/PTS/XYZBIN point clouds
+        "las": ["laspy>=2.0.0"],    # LAS/LAZ support
+        "e57": ["pye57"],           # E57 support
         "full": [
             "open3d>=0.17.0",
             "laspy>=2.0.0",
             "pye57",  # For E57 support
+            "pandas",  # Faster PTS parsing
+            "numba",   # Parallel point statistics
         ]
     },
     entry_points={
@@ -0,0 +1,51 @@
+import json
+import pytest
+
+from components.core.config.config_manager import ConfigManager
+
+@pytest.mark.parametrize("noise", ["null", '"2mm"'])
+def test_malformed_preset_header_is_reported_per_preset(tmp_path, noise):
+    presets_dir = tmp_path / "presets"
+    presets_dir.mkdir()
+    (presets_dir / "good.yaml").write_text('scanner:\n  name: "Good"\n  typical_noise: 0.002\n')
+    (presets_dir / "bad.yaml").write_text(f'scanner:\n  name: "Bad"\n  typical_noise: {noise}\n')
+    
+    (bad, bad_error), (good, good_error) = ConfigManager(tmp_path).load_preset_headers(["bad", "good"])
+    
+    assert bad is None and isinstance(bad_error, (TypeError, ValueError))
+    assert good_error is None
+    assert good['name'] == "Good" and good['typical_noise'] == 0.002
+
+def test_template_edits_take_effect(tmp_path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    template = templates_dir / "default.yaml"
+    template.write_text('scanner:\n  name: "T"\n  typical_noise: 0.005\nthinning:\n  method: voxel\n  voxel_size: 0.025\n')
+    manager = ConfigManager(tmp_path)
+    
+    assert manager.create_preset_from_template("a", "S", 0.002).thinning.voxel_size == 0.025
+    template.write_text(template.read_text().replace("0.025", "0.0125"))
+    config = manager.create_preset_from_template("b", "S", 0.002)
+    assert config.thinning.voxel_size == 0.0125
+    assert config.scanner.name == "S"
+
+def test_missing_template_falls_back_to_noise_scaled_default(tmp_path):
+    config = ConfigManager(tmp_path).create_preset_from_template("a", "S", 0.002)
+    
+    assert config.thinning.voxel_size == pytest.approx(0.002 * 5)
+    assert config.cleaning.radius_outlier['radius'] == pytest.approx(0.002 * 25)
+    assert config.reflection.glass_detection
+
+def test_preset_sidecar_is_json_and_round_trips(tmp_path):
+    presets_dir = tmp_path / "presets"
+    presets_dir.mkdir()
+    (presets_dir / "p.yaml").write_text('scanner:\n  name: "P"\n  typical_noise: 0.003\n')
+    
+    cold = ConfigManager(tmp_path).load_preset("p")
+    (sidecar,) = (presets_dir / ".cache").glob("p.*.json")
+    assert json.loads(sidecar.read_text())['scanner']['name'] == "P"
+    assert ConfigManager(tmp_path).load_preset("p") == cold
+    
+    # A corrupt sidecar is ignored in favour of the YAML
+    sidecar.write_text("not json")
+    assert ConfigManager(tmp_path).load_preset("p") == cold
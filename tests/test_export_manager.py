@@ -0,0 +1,85 @@
+import json
+import types
+
+import numpy as np
+import pytest
+
+from components.core.io.export_manager import PointCloudExporter, xyzbin_header_path
+from components.core.io.multi_format_loader import (
+    PointCloudLoader, _load_binary_mmap, _read_binary_header, _read_xyzbin_header
+)
+
+def _cloud(points, colors=(), normals=()):
+    """Duck-typed stand-in for an Open3D PointCloud."""
+    return types.SimpleNamespace(points=points, colors=np.asarray(colors), normals=np.asarray(normals))
+
+def _georeferenced_points(n=1000):
+    rng = np.random.default_rng(0)
+    return np.column_stack([rng.uniform(500000.0, 500100.0, n),
+                            rng.uniform(6000000.0, 6000100.0, n),
+                            rng.uniform(0.0, 10.0, n)])
+
+def _read_back(path):
+    return np.concatenate([np.column_stack([c['x'], c['y'], c['z']])
+                           for c in PointCloudLoader().load_chunks(path, chunk_points=256)])
+
+def test_xyzbin_export_keeps_millimeters_far_from_origin(tmp_path):
+    points = _georeferenced_points()
+    path = tmp_path / "cloud.xyzbin"
+    assert PointCloudExporter().export(_cloud(points), path)
+    
+    header = json.loads(xyzbin_header_path(path).read_text())
+    assert header['version'] == 2
+    assert header['offset'] == list(np.floor(points[0]))
+    np.testing.assert_allclose(_read_back(path), points, rtol=0, atol=1e-4)
+
+def test_xyzbin_stream_matches_export(tmp_path):
+    points = _georeferenced_points()
+    chunk = np.empty(len(points), dtype=[('x', '<f8'), ('y', '<f8'), ('z', '<f8')])
+    for i, field in enumerate(('x', 'y', 'z')):
+        chunk[field] = points[:, i]
+    
+    path = tmp_path / "cloud.xyzbin"
+    with PointCloudExporter().stream(path) as writer:
+        for start in range(0, len(chunk), 300):
+            writer.write_chunk(chunk[start:start + 300])
+    
+    assert _read_xyzbin_header(path).count == len(points)
+    np.testing.assert_allclose(_read_back(path), points, rtol=0, atol=1e-4)
+
+def test_xyzbin_version_1_has_no_offset(tmp_path):
+    points = np.random.default_rng(1).uniform(-50.0, 50.0, size=(100, 3)).astype('<f4')
+    path = tmp_path / "old.xyzbin"
+    points.tofile(path)
+    xyzbin_header_path(path).write_text(json.dumps(
+        {'format': 'xyzbin', 'version': 1, 'dtype': '<f4', 'columns': ['x', 'y', 'z'], 'points': 100}))
+    
+    np.testing.assert_array_equal(_read_xyzbin_header(path).origin, np.zeros(3))
+    np.testing.assert_array_equal(_read_back(path), points)
+
+@pytest.mark.parametrize("with_normals, with_colors", [(False, False), (True, False), (False, True), (True, True)])
+def test_binary_ply_round_trip(tmp_path, with_normals, with_colors):
+    rng = np.random.default_rng(2)
+    points = rng.uniform(-100.0, 100.0, size=(500, 3))
+    normals = rng.uniform(-1.0, 1.0, size=(500, 3)) if with_normals else ()
+    colors = rng.uniform(0.0, 1.0, size=(500, 3)) if with_colors else ()
+    path = tmp_path / "cloud.ply"
+    
+    exporter = PointCloudExporter()
+    assert exporter.export(_cloud(points, colors, normals), path)
+    
+    header = _read_binary_header(path)
+    records = _load_binary_mmap(path, header)
+    assert header.offset + records.nbytes == path.stat().st_size
+    assert exporter.get_export_stats()['file_size_mb'] * 1024 * 1024 == path.stat().st_size
+    np.testing.assert_array_equal(np.column_stack([records[f] for f in ('x', 'y', 'z')]), points)
+    if with_normals:
+        np.testing.assert_array_equal(np.column_stack([records[f] for f in ('nx', 'ny', 'nz')]), normals)
+    else:
+        assert 'nx' not in records.dtype.names
+    if with_colors:
+        # Rounded to the nearest 8-bit value, like Open3D's writer
+        np.testing.assert_array_equal(np.column_stack([records[f] for f in ('red', 'green', 'blue')]),
+                                      np.rint(colors * 255))
+    else:
+        assert 'red' not in records.dtype.names
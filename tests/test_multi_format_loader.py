@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from components.core.io.multi_format_loader import (
+    PointCloudLoader, _load_binary_mmap, _parse_pcd_header, _parse_ply_header, _read_binary_header
+)
+
+def _ply_head(body, fmt="binary_little_endian"):
+    return f"ply\nformat {fmt} 1.0\n{body}end_header\n".encode('ascii')
+
+XYZ_PROPS = "property float x\nproperty float y\nproperty float z\n"
+
+def _write_ply(path, records, fmt):
+    order = '>' if fmt == "binary_big_endian" else '<'
+    types = {'f4': 'float', 'f8': 'double', 'u1': 'uchar'}
+    props = ''.join(f"property {types[records.dtype[name].str[1:]]} {name}\n"
+                    for name in records.dtype.names)
+    path.write_bytes(_ply_head(f"element vertex {len(records)}\n{props}", fmt)
+                     + records.astype(records.dtype.newbyteorder(order)).tobytes())
+
+@pytest.mark.parametrize("fmt", ["binary_little_endian", "binary_big_endian"])
+def test_ply_mmap_round_trip(tmp_path, fmt):
+    rng = np.random.default_rng(0)
+    records = np.empty(50, dtype=[('x', '<f4'), ('y', '<f4'), ('z', '<f4'),
+                                  ('nx', '<f8'), ('ny', '<f8'), ('nz', '<f8'),
+                                  ('red', 'u1'), ('green', 'u1'), ('blue', 'u1')])
+    for name in records.dtype.names:
+        records[name] = rng.uniform(0, 255, len(records))
+    path = tmp_path / "cloud.ply"
+    _write_ply(path, records, fmt)
+    
+    header = _read_binary_header(path)
+    mapped = _load_binary_mmap(path, header)
+    assert not mapped.flags.writeable
+    for name in records.dtype.names:
+        np.testing.assert_array_equal(mapped[name], records[name])
+    
+    loader = PointCloudLoader()
+    chunk = np.concatenate(list(loader.load_chunks(path, chunk_points=16)))
+    assert loader.get_load_info()['has_normals']
+    for field, name in zip('xyzrgb', ('x', 'y', 'z', 'red', 'green', 'blue')):
+        np.testing.assert_array_equal(chunk[field], records[name])
+
+@pytest.mark.parametrize("head", [
+    _ply_head(f"element vertex 1\n{XYZ_PROPS}", fmt="ascii"),
+    _ply_head(f"element vertex 1\n{XYZ_PROPS}property ushort red\nproperty ushort green\nproperty ushort blue\n"),
+    _ply_head(f"element vertex 1\n{XYZ_PROPS}property float red\nproperty float green\nproperty float blue\n"),
+    _ply_head(f"element vertex 1\n{XYZ_PROPS}property list uchar int vertex_indices\n"),
+    _ply_head(f"element face 1\nproperty list uchar int vertex_indices\nelement vertex 1\n{XYZ_PROPS}"),
+])
+def test_ply_header_rejects_unmappable_layouts(head):
+    assert _parse_ply_header(head) is None
+
+def _pcd_head(points, data="binary"):
+    return (f"# .PCD v0.7\nVERSION 0.7\nFIELDS x y z rgb\nSIZE 4 4 4 4\nTYPE F F F F\n"
+            f"COUNT 1 1 1 1\nWIDTH {points}\nHEIGHT 1\nPOINTS {points}\nDATA {data}\n").encode('ascii')
+
+def test_pcd_packed_rgb_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    colors = rng.integers(0, 256, size=(20, 3), dtype=np.uint32)
+    records = np.empty(20, dtype=[('x', '<f4'), ('y', '<f4'), ('z', '<f4'), ('rgb', '<f4')])
+    for name in ('x', 'y', 'z'):
+        records[name] = rng.uniform(-10, 10, len(records))
+    records['rgb'] = ((colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]).view(np.float32)
+    path = tmp_path / "cloud.pcd"
+    path.write_bytes(_pcd_head(len(records)) + records.tobytes())
+    
+    chunk = np.concatenate(list(PointCloudLoader().load_chunks(path, chunk_points=8)))
+    for name in ('x', 'y', 'z'):
+        np.testing.assert_array_equal(chunk[name], records[name])
+    np.testing.assert_array_equal(np.column_stack([chunk['r'], chunk['g'], chunk['b']]), colors)
+
+@pytest.mark.parametrize("data", ["ascii", "binary_compressed"])
+def test_pcd_header_rejects_non_binary_data(data):
+    assert _parse_pcd_header(_pcd_head(1, data)) is None
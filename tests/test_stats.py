@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from components.core.io.point_record import point_dtype
+from components.core.utils import stats
+from components.core.utils.stats import bbox
+
+@pytest.fixture(autouse=True)
+def kernel_for_small_arrays(monkeypatch):
+    # Send even tiny arrays through the numba kernel (when installed)
+    monkeypatch.setattr(stats, '_NUMBA_MIN_POINTS', 0)
+
+@pytest.mark.parametrize("n", list(range(1, 40)) + [1000, 4097])
+def test_bbox_matches_numpy(n):
+    points = np.random.default_rng(n).uniform(10.0, 11.0, size=(n, 3))
+    mn, mx = bbox(points)
+    np.testing.assert_array_equal(mn, points.min(axis=0))
+    np.testing.assert_array_equal(mx, points.max(axis=0))
+
+def test_bbox_rejects_empty():
+    with pytest.raises(ValueError):
+        bbox(np.empty((0, 3)))
+
+@pytest.mark.parametrize("float64", [False, True])
+def test_bbox_on_point_record_view(float64):
+    records = np.zeros(1000, dtype=point_dtype(float64))
+    records['xyz'] = np.random.default_rng(0).uniform(-5.0, 5.0, size=(1000, 3))
+    xyz = records['xyz']
+    assert xyz.flags.aligned
+    mn, mx = bbox(xyz)
+    np.testing.assert_array_equal(mn, xyz.min(axis=0))
+    np.testing.assert_array_equal(mx, xyz.max(axis=0))
+
+def test_numba_is_not_imported_for_small_arrays(monkeypatch):
+    monkeypatch.setattr(stats, '_NUMBA_MIN_POINTS', 10)
+    stats._bbox_kernel.cache_clear()
+    bbox(np.zeros((5, 3)))
+    assert stats._bbox_kernel.cache_info().misses == 0
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+CloudForge CLI - Scan-to-BIM Point Cloud Processing Toolkit
+Main command-line interface for point cloud processing operations.
+"""
+
+import click
+import importlib
+from pathlib import Path
+import sys
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from components.core.config.config_manager import ConfigManager
+
+# Point cloud IO pulls in numpy/open3d/laspy, which dominates startup;
+# only the commands that read or write clouds import it.
+def _make_loader():
+    from components.core.io.multi_format_loader import PointCloudLoader
+    return PointCloudLoader()
+
+def _make_exporter():
+    from components.core.io.export_manager import PointCloudExporter
+    return PointCloudExporter()
+
+# Command name -> module under tools.cloudforge_cli.commands
+_NAME_MAP = {
+    'process': 'process',
+    'process-batch': 'process',
+    'extract-bim': 'process',
+    'validate': 'process',
+    'info': 'info',
+    'list-presets': 'presets',
+    'create-preset': 'presets',
+    'validate-config': 'presets',
+    'stats': 'stats',
+    'reset-stats': 'stats',
+}
+
+class LazyCLI(click.Group):
+    """
+    Click group that imports a command's module only when it is invoked.
+    
+    Running one command no longer builds every other command's options.
+    """
+    
+    def list_commands(self, ctx):
+        return sorted(_NAME_MAP)
+    
+    def get_command(self, ctx, name):
+        if name not in _NAME_MAP:
+            return None
+        module = importlib.import_module(f'tools.cloudforge_cli.commands.{_NAME_MAP[name]}')
+        return getattr(module, name.replace('-', '_'))
+
+@click.group(cls=LazyCLI)
+@click.version_option(version='0.1.0', prog_name='CloudForge')
+@click.option('--config-dir', type=click.Path(), help='Configuration directory path')
+@click.pass_context
+def cli(ctx, config_dir):
+    """
+    CloudForge - Scan-to-BIM Point Cloud Processing Toolkit
+    
+    Process, clean, and extract BIM elements from point clouds.
+    """
+    ctx.ensure_object(dict)
+    
+    # Initialize global configuration manager
+    if config_dir:
+        config_dir = Path(config_dir)
+    else:
+        config_dir = project_root / "config"
+    
+    ctx.obj['config_manager'] = ConfigManager(config_dir)
+    ctx.obj['loader_factory'] = _make_loader
+    ctx.obj['exporter_factory'] = _make_exporter
+
+if __name__ == '__main__':
+    cli()
\ No newline at end of file
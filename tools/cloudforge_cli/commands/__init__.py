@@ -0,0 +1 @@
+"""CloudForge CLI subcommands, one module per command family."""
@@ -0,0 +1,47 @@
+"""
+Point cloud inspection command: info.
+"""
+
+import click
+from pathlib import Path
+
+_BOUNDS_LINE = "  {}: {:.3f} to {:.3f} ({:.3f}m)".format
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--float64', is_flag=True,
+              help='Hold absolute float64 coordinates instead of origin-relative float32')
+def info(input_file, float64):
+    """Get information about a point cloud file."""
+    from components.core.io.multi_format_loader import PointCloudLoader
+    
+    loader = PointCloudLoader()
+    
+    try:
+        click.echo(f"Analyzing: {input_file}")
+        pc = loader.load_array(Path(input_file), float64=float64)
+        info = pc.info
+        
+        click.echo(f"\n📊 Point Cloud Information:")
+        click.echo(f"  Format: {info['format']}")
+        click.echo(f"  Points: {info['points']:,}")
+        
+        if info.get('has_colors'):
+            click.echo(f"  Colors: ✓")
+        if info.get('has_normals'):
+            click.echo(f"  Normals: ✓")
+        if info.get('has_intensity'):
+            click.echo(f"  Intensity: ✓")
+        
+        # Basic statistics
+        mn, mx = pc.bounds()
+        size = mx - mn
+        
+        click.echo("\n".join([
+            "\n📐 Bounding Box:",
+            *(_BOUNDS_LINE(axis, mn[k], mx[k], size[k]) for k, axis in enumerate('XYZ'))
+        ]))
+        
+    except Exception as e:
+        click.echo(f"✗ Failed to analyze file: {e}", err=True)
+        return 1
@@ -0,0 +1,73 @@
+"""
+Scanner preset commands: list-presets, create-preset, validate-config.
+"""
+
+import click
+from pathlib import Path
+
+_PRESET_LINE = "  {:<20} - {} ({:.1f}mm noise)".format
+_INVALID_PRESET_LINE = "  {:<20} - ⚠ Invalid preset: {}".format
+
+@click.command()
+@click.pass_context
+def list_presets(ctx):
+    """List all available scanner presets."""
+    config_manager = ctx.obj['config_manager']
+    presets = config_manager.list_presets()
+    
+    if not presets:
+        click.echo("No presets found.")
+        return
+    
+    presets = sorted(presets)
+    # Uncached preset files are read concurrently; results keep input order
+    results = config_manager.load_preset_headers(presets)
+    
+    # Build the listing up front and write it with a single echo
+    lines = ["Available scanner presets:"]
+    for preset, (header, error) in zip(presets, results):
+        if error is not None:
+            lines.append(_INVALID_PRESET_LINE(preset, error))
+            continue
+        noise = header['typical_noise'] * 1000  # Convert to mm
+        lines.append(_PRESET_LINE(preset, header['name'], noise))
+    click.echo('\n'.join(lines))
+
+@click.command()
+@click.option('--name', required=True, help='Name for the new preset')
+@click.option('--scanner', required=True, help='Scanner model name')
+@click.option('--noise', type=float, required=True, help='Typical noise in millimeters')
+@click.option('--based-on', default='default', help='Template to base preset on')
+@click.pass_context
+def create_preset(ctx, name, scanner, noise, based_on):
+    """Create a new scanner preset."""
+    config_manager = ctx.obj['config_manager']
+    
+    try:
+        noise_meters = noise / 1000.0  # Convert mm to meters
+        config = config_manager.create_preset_from_template(
+            name, scanner, noise_meters, based_on
+        )
+        click.echo(f"✓ Created preset '{name}' for {scanner}")
+        click.echo(f"  Noise level: {noise}mm")
+        click.echo(f"  Voxel size: {config.thinning.voxel_size*1000:.1f}mm")
+    except Exception as e:
+        click.echo(f"✗ Failed to create preset: {e}", err=True)
+        return 1
+
+@click.command()
+@click.argument('config_file', type=click.Path(exists=True))
+@click.pass_context
+def validate_config(ctx, config_file):
+    """Validate a configuration file."""
+    config_manager = ctx.obj['config_manager']
+    
+    config_file_path = Path(config_file)
+    
+    # Structural check first; only well-formed files get full schema validation
+    if (config_manager.quick_validate(config_file_path)
+            and config_manager.validate_config_file(config_file_path)):
+        click.echo(f"✓ Configuration file {config_file} is valid")
+    else:
+        click.echo(f"✗ Configuration file {config_file} is invalid", err=True)
+        return 1
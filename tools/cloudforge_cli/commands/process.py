@@ -0,0 +1,270 @@
+"""
+Point cloud processing commands: process, process-batch, extract-bim, validate.
+"""
+
+import click
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import glob
+import os
+from typing import Optional
+
+from components.core.config.config_manager import ConfigManager
+from components.core.utils.progress_tracker import progress
+
+def _derive_output(input_file: str, fmt: str, user_out: Optional[str] = None) -> str:
+    """
+    Output path for a processed file: user_out if given, otherwise
+    <input stem>_processed.<fmt> next to the input.
+    
+    Uses os.path string operations, which are cheap enough to run per file
+    in large batches; callers wrap the result in Path where needed.
+    """
+    if user_out:
+        return user_out
+    
+    directory, name = os.path.split(input_file)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(directory, f"{stem}_processed.{fmt}")
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--preset', default='leica_rtc360', help='Scanner preset to use')
+@click.option('--output', '-o', type=click.Path(), help='Output file path')
+@click.option('--format', 'output_format', default='ply', help='Output format (ply, pcd, pts, xyz, xyzbin)')
+@click.option('--skip-cleaning', is_flag=True, help='Skip cleaning operations')
+@click.option('--skip-thinning', is_flag=True, help='Skip thinning operations')
+@click.option('--mmap/--no-mmap', 'use_mmap', default=False,
+              help='Memory-map binary PLY/PCD/XYZBIN input instead of reading it')
+@click.option('--jobs', '-j', type=int, default=min(4, os.cpu_count() or 1), show_default=True,
+              help='Threads decoding LAS/LAZ input when it is loaded whole '
+                   '(pts/xyz/xyzbin outputs stream LAS/LAZ on one thread)')
+@click.option('--progress-off', is_flag=True,
+              help='Disable progress bars (also off when stderr is not a terminal or CLOUDFORGE_NO_PROGRESS is set)')
+@click.pass_context
+def process(ctx, input_file, preset, output, output_format, skip_cleaning, skip_thinning, use_mmap, jobs,
+            progress_off):
+    """
+    Process a point cloud file with cleaning and thinning operations.
+    
+    INPUT_FILE: Path to the input point cloud file
+    """
+    config_manager = ctx.obj['config_manager']
+    loader = ctx.obj['loader_factory']()
+    exporter = ctx.obj['exporter_factory']()
+    
+    input_path = Path(input_file)
+    output_path = Path(_derive_output(input_file, output_format, output))
+    
+    try:
+        # Load configuration
+        click.echo(f"Loading preset: {preset}")
+        config = config_manager.load_preset(preset)
+        
+        # Text and raw binary outputs are streamed chunk by chunk
+        streaming = output_path.suffix.lower() in exporter.streamable_formats
+        
+        # Load point cloud
+        click.echo(f"Loading point cloud: {input_path}")
+        if streaming:
+            # PTS carries colors; gray them from LAS intensity like load() does
+            chunks = loader.load_chunks(input_path,
+                                        gray_intensity=output_path.suffix.lower() == '.pts',
+                                        use_mmap=use_mmap)
+        else:
+            with progress("Loading point cloud", enabled=not progress_off) as tracker:
+                pcd = loader.load(input_path, use_mmap=use_mmap, jobs=jobs)
+                tracker.update(100)
+        
+        load_info = loader.get_load_info()
+        click.echo(f"Loaded {load_info['points']:,} points from {load_info['format']} file")
+        
+        if load_info.get('has_colors'):
+            click.echo("✓ Point cloud includes color information")
+        if load_info.get('has_intensity'):
+            click.echo("✓ Point cloud includes intensity information")
+        
+        # Processing pipeline
+        if not skip_cleaning:
+            click.echo("Cleaning point cloud...")
+            # TODO: Implement cleaning operations
+            click.echo("⚠ Cleaning operations not yet implemented")
+        
+        if not skip_thinning:
+            click.echo("Thinning point cloud...")
+            # TODO: Implement thinning operations  
+            click.echo("⚠ Thinning operations not yet implemented")
+        
+        # Export result
+        click.echo(f"Exporting to: {output_path}")
+        if streaming:
+            with progress("Streaming point cloud", total=load_info['points'],
+                          enabled=not progress_off) as tracker:
+                with exporter.stream(output_path) as writer:
+                    for chunk in chunks:
+                        writer.write_chunk(chunk)
+                        tracker.update(len(chunk))
+            success = True
+        else:
+            with progress("Exporting point cloud", enabled=not progress_off) as tracker:
+                success = exporter.export(pcd, output_path)
+                tracker.update(100)
+        
+        if success:
+            export_stats = exporter.get_export_stats()
+            click.echo(f"✓ Export completed: {export_stats['points_exported']:,} points")
+            click.echo(f"  File size: {export_stats['file_size_mb']:.1f} MB")
+        else:
+            click.echo("✗ Export failed")
+            return 1
+            
+    except Exception as e:
+        click.echo(f"✗ Processing failed: {e}", err=True)
+        return 1
+
+def _process_one(input_file: str, preset: str, output_format: str, config_dir: str, use_mmap: bool) -> dict:
+    """
+    Load, process and export one file inside a process-batch worker.
+    
+    Lives at module level so ProcessPoolExecutor can pickle it. Like
+    process, pts/xyz/xyzbin outputs are streamed chunk by chunk.
+    """
+    config_manager = ConfigManager(config_dir)
+    config_manager.load_preset(preset)
+    from components.core.io.multi_format_loader import PointCloudLoader
+    from components.core.io.export_manager import PointCloudExporter
+    
+    loader = PointCloudLoader()
+    exporter = PointCloudExporter()
+    
+    output_file = _derive_output(input_file, output_format)
+    suffix = os.path.splitext(output_file)[1].lower()
+    
+    # Cleaning and thinning are not implemented yet; process_batch warns once
+    if suffix in exporter.streamable_formats:
+        chunks = loader.load_chunks(input_file, gray_intensity=suffix == '.pts', use_mmap=use_mmap)
+        with exporter.stream(output_file) as writer:
+            for chunk in chunks:
+                writer.write_chunk(chunk)
+        success = True
+    else:
+        pcd = loader.load(input_file, use_mmap=use_mmap)
+        success = exporter.export(pcd, output_file)
+    
+    return {
+        'output_file': output_file,
+        'points': loader.get_load_info()['points'],
+        'success': success
+    }
+
+@click.command()
+@click.argument('pattern')
+@click.option('--preset', default='leica_rtc360', help='Scanner preset to use')
+@click.option('--format', 'output_format', default='ply', help='Output format (ply, pcd, pts, xyz, xyzbin)')
+@click.option('--jobs', '-j', type=int, default=None, help='Worker processes (default: CPU count)')
+@click.option('--mmap/--no-mmap', 'use_mmap', default=False,
+              help='Memory-map binary PLY/PCD/XYZBIN input instead of reading it')
+@click.pass_context
+def process_batch(ctx, pattern, preset, output_format, jobs, use_mmap):
+    """
+    Process every point cloud matching a glob pattern in parallel.
+    
+    PATTERN: Glob pattern for input files, e.g. "scans/**/*.las"
+    """
+    config_manager = ctx.obj['config_manager']
+    input_files = sorted(glob.glob(pattern, recursive=True))
+    
+    if not input_files:
+        click.echo(f"✗ No files match {pattern}", err=True)
+        ctx.exit(1)
+    
+    try:
+        # Fail fast on a bad preset instead of once per worker
+        config_manager.load_preset(preset)
+    except Exception as e:
+        click.echo(f"✗ Processing failed: {e}", err=True)
+        ctx.exit(1)
+    
+    workers = jobs or os.cpu_count() or 1
+    click.echo(f"Processing {len(input_files)} files with {workers} workers")
+    click.echo("⚠ Cleaning operations not yet implemented")
+    click.echo("⚠ Thinning operations not yet implemented")
+    
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_process_one, input_file, preset, output_format,
+                            str(config_manager.config_dir), use_mmap): input_file
+            for input_file in input_files
+        }
+        for future in as_completed(futures):
+            input_file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failures += 1
+                click.echo(f"✗ {input_file}: {e}", err=True)
+                continue
+            
+            if result['success']:
+                click.echo(f"✓ {input_file} -> {result['output_file']} ({result['points']:,} points)")
+            else:
+                failures += 1
+                click.echo(f"✗ {input_file}: export failed", err=True)
+    
+    click.echo(f"Processed {len(input_files) - failures}/{len(input_files)} files")
+    if failures:
+        ctx.exit(1)
+
+class ElementSet(click.ParamType):
+    """Comma-separated BIM element names, validated and parsed to a frozenset."""
+    
+    name = 'elementset'
+    VALID = frozenset({'walls', 'floors', 'ceilings', 'columns'})
+    
+    def convert(self, value, param, ctx):
+        if isinstance(value, frozenset):
+            return value
+        
+        items = frozenset(item.strip().lower() for item in value.split(',') if item.strip())
+        if not items:
+            self.fail("no elements given", param, ctx)
+        
+        unknown = items - self.VALID
+        if unknown:
+            self.fail(f"unknown element(s): {', '.join(sorted(unknown))}. "
+                      f"Valid: {', '.join(sorted(self.VALID))}", param, ctx)
+        return items
+
+@click.command()
+@click.argument('input_file', type=click.Path(exists=True))
+@click.option('--elements', type=ElementSet(), default='walls,floors',
+              help='BIM elements to extract (comma-separated: walls, floors, ceilings, columns)')
+@click.option('--format', 'output_format', type=click.Choice(['ifc', 'json']), default='ifc',
+              help='Output format')
+@click.option('--output', '-o', type=click.Path(), help='Output file path')
+def extract_bim(input_file, elements, output_format, output):
+    """
+    Extract BIM elements from a point cloud.
+    
+    INPUT_FILE: Path to the input point cloud file
+    """
+    click.echo("⚠ BIM extraction not yet implemented")
+    click.echo(f"Would extract: {','.join(sorted(elements))} from {input_file}")
+    # TODO: Implement BIM extraction
+
+@click.command()
+@click.argument('scan1', type=click.Path(exists=True))
+@click.argument('scan2', type=click.Path(exists=True))
+@click.option('--report', type=click.Path(), help='Output HTML report path')
+@click.option('--threshold', default=0.05, help='Alignment threshold in meters')
+def validate(scan1, scan2, report, threshold):
+    """
+    Validate alignment between two point cloud scans.
+    
+    SCAN1: Path to the first scan
+    SCAN2: Path to the second scan
+    """
+    click.echo("⚠ Alignment validation not yet implemented")
+    click.echo(f"Would validate alignment between {scan1} and {scan2}")
+    # TODO: Implement alignment validation
@@ -0,0 +1,18 @@
+"""
+Usage statistics commands: stats, reset-stats.
+"""
+
+import click
+
+from components.core.utils.progress_tracker import print_usage_report, reset_usage_stats
+
+@click.command()
+def stats():
+    """Show usage statistics."""
+    print_usage_report()
+
+@click.command()
+def reset_stats():
+    """Reset usage statistics."""
+    reset_usage_stats()
+    click.echo("✓ Usage statistics reset")